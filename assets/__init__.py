@@ -0,0 +1,5 @@
+from .disk_cache import DiskCache, disk_cache
+from .loader import AssetLoader, loader, lower_thread_priority
+from .registry import AssetRegistry, registry
+from .text_cache import TextCache, quantize_scale, text_cache
+from .transform_cache import TransformCache, transforms
@@ -0,0 +1,185 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+
+import pygame
+
+from config import ASSET_CACHE_DIR, ASSET_CACHE_MAX_BYTES, ASSET_DISK_CACHE
+from logger_config import logger
+
+# Entry layout: HEADER (magic, source size, source mtime in ns, metadata length), JSON metadata, zero
+# padding up to a multiple of ALIGN, then the raw pixels or PCM samples until the end of the file
+MAGIC = b'PKCACHE1'
+HEADER = struct.Struct('<8sQqI')
+ALIGN = 16
+SUFFIX = '.bin'
+
+# Byte order of a 32 bit surface with the usual display masks (0xFF0000, 0xFF00, 0xFF) on this machine
+PIXEL_FORMAT = 'BGRA' if struct.pack('=I', 1)[0] == 1 else 'ARGB'
+
+
+class DiskCache:
+    """
+    Keeps decoded images and sounds in directory so later launches skip PNG and MP3 decoding.
+
+    An entry is found by source path and variant (alpha conversion, mixer format) and is only used while
+    the source file still has the size and modification time it was decoded from, otherwise it is decoded
+    again and overwritten. Pixels are memory-mapped straight into a surface, PCM is handed to
+    Sound(buffer=...). Past max_bytes the least recently used entries are deleted.
+    """
+    def __init__(self, directory=ASSET_CACHE_DIR, max_bytes=ASSET_CACHE_MAX_BYTES, enabled=ASSET_DISK_CACHE):
+        self.log = logger.getChild(__name__)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()  # sounds are loaded from background threads
+        self.hits = 0
+        self.misses = 0
+
+    def load_image(self, path, alpha=False):
+        """Surface for an image file, in the display's format once a display exists."""
+        if pygame.display.get_surface() is None:
+            # convert() needs a display mode, headless tools keep the file's own format and skip the cache
+            return pygame.image.load(path)
+
+        variant = f"image alpha={alpha}"
+        entry = self._read(path, variant, self._valid_image)
+        if entry is not None:
+            meta, data = entry
+            surface = pygame.image.frombuffer(data, tuple(meta['size']), meta['format'])
+            # Converted like a decoded image, so blits take the same fast path either way
+            return surface.convert_alpha() if alpha else surface.convert()
+
+        surface = pygame.image.load(path)
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        meta = {'size': surface.get_size(), 'format': PIXEL_FORMAT}
+        self._write(path, variant, meta, pygame.image.tobytes(surface, PIXEL_FORMAT))
+        return surface
+
+    def load_sound(self, path):
+        """Sound for an audio file, its PCM is cached in the current mixer format."""
+        variant = f"sound mixer={pygame.mixer.get_init()}"
+        entry = self._read(path, variant, self._valid_sound)
+        if entry is not None:
+            return pygame.mixer.Sound(buffer=entry[1])
+
+        sound = pygame.mixer.Sound(path)
+        self._write(path, variant, {}, sound.get_raw())
+        return sound
+
+    def clear(self):
+        """Delete every cache entry."""
+        if not os.path.isdir(self.directory):
+            return
+        with self._lock:
+            for name, _, _ in self._entries():
+                os.remove(os.path.join(self.directory, name))
+
+    def _entry_path(self, path, variant):
+        key = hashlib.sha1(f"{os.path.abspath(path)}|{variant}".encode()).hexdigest()
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def _read(self, path, variant, valid=None):
+        """(metadata, buffer) of a valid entry, None on a miss. valid(meta, data) checks the payload."""
+        if not self.enabled:
+            return None
+        entry_path = self._entry_path(path, variant)
+        try:
+            source = os.stat(path)
+            with open(entry_path, 'rb') as f:
+                magic, size, mtime_ns, meta_length = HEADER.unpack(f.read(HEADER.size))
+                if magic != MAGIC or size != source.st_size or mtime_ns != source.st_mtime_ns:
+                    self.misses += 1
+                    return None
+                meta = json.loads(f.read(meta_length))
+                # Copy-on-write so a surface drawn on never writes back to the file
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            data = memoryview(mapped)[self._data_offset(meta_length):]
+            if valid is not None and not valid(meta, data):
+                # Truncated or otherwise damaged, decoded again and rewritten by the caller
+                self.log.warning("Discarding corrupt cache entry for %s", path)
+                os.remove(entry_path)
+                self.misses += 1
+                return None
+            # Touched on every hit, pruning removes the entries with the oldest times first
+            os.utime(entry_path)
+        except (OSError, ValueError, struct.error):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return meta, data
+
+    @staticmethod
+    def _valid_image(meta, data):
+        """The pixels of a 32 bit image of the recorded size, nothing more or less."""
+        try:
+            width, height = meta['size']
+            return meta['format'] == PIXEL_FORMAT and len(data) == width * height * 4
+        except (KeyError, TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def _valid_sound(meta, data):
+        """Whole sample frames in the current mixer format, at least one of them."""
+        _, bits, channels = pygame.mixer.get_init()
+        frame_size = channels * abs(bits) // 8
+        return len(data) > 0 and len(data) % frame_size == 0
+
+    def _write(self, path, variant, meta, data):
+        if not self.enabled:
+            return
+        entry_path = self._entry_path(path, variant)
+        temp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            source = os.stat(path)
+            meta_bytes = json.dumps(meta).encode()
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, source.st_size, source.st_mtime_ns, len(meta_bytes)))
+                f.write(meta_bytes)
+                f.write(bytes(self._data_offset(len(meta_bytes)) - HEADER.size - len(meta_bytes)))
+                f.write(data)
+            # Readers see either the old entry or the complete new one
+            os.replace(temp_path, entry_path)
+        except OSError as e:
+            self.log.warning("Could not cache %s: %s", path, e)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+        self._prune()
+
+    @staticmethod
+    def _data_offset(meta_length):
+        return -(-(HEADER.size + meta_length) // ALIGN) * ALIGN
+
+    def _entries(self):
+        """[(name, bytes, last used)] of every entry in the directory."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(SUFFIX):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((name, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _prune(self):
+        with self._lock:
+            try:
+                entries = sorted(self._entries(), key=lambda entry: entry[2])
+                total = sum(size for _, size, _ in entries)
+                for name, size, _ in entries:
+                    if total <= self.max_bytes:
+                        break
+                    # Files mapped by a live surface stay readable until it is gone
+                    os.remove(os.path.join(self.directory, name))
+                    total -= size
+                    self.log.debug("Evicted %s from the disk cache", name)
+            except OSError as e:
+                self.log.warning("Could not prune the disk cache: %s", e)
+
+
+# Shared by the asset registry, the sound bank and the music player
+disk_cache = DiskCache()
@@ -0,0 +1,84 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from config import ASSET_LOADER_WORKERS
+from logger_config import logger
+
+
+def lower_thread_priority():
+    """Background loaders yield the CPU to the game thread, which matters most on single-core machines."""
+    if hasattr(os, 'setpriority'):
+        try:
+            # Linux applies a thread id's niceness to that thread only
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+        except OSError:
+            pass
+
+
+class AssetLoader:
+    """
+    Thread pool that decodes images, sounds and music while the game keeps drawing frames.
+
+    Jobs are counted in batches: every job submitted or tracked while others are still running joins
+    the current batch, whose progress the intro screen shows, and a new batch starts once all of them
+    have finished. Only unfinished futures are kept. Nothing waits on the pool as a whole: whoever
+    needs an asset blocks on that asset's future only.
+    """
+    def __init__(self, workers=ASSET_LOADER_WORKERS):
+        self.log = logger.getChild(__name__)
+        # Decoding is CPU bound, threads beyond the core count only slow the game thread down
+        workers = min(workers, os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='asset-load',
+                                            initializer=lower_thread_priority)
+        self._lock = threading.Lock()  # futures finish on the worker threads
+        self._running = set()
+        self._batch_size = 0
+        self._batch_finished = 0
+
+    def submit(self, fn, *args):
+        """Run fn(*args) on the pool, returns its Future."""
+        return self.track(self._executor.submit(fn, *args))
+
+    def track(self, future):
+        """Count a job running elsewhere (e.g. the music decoder) towards progress."""
+        with self._lock:
+            self._running.add(future)
+            self._batch_size += 1
+        future.add_done_callback(self._finished)
+        return future
+
+    @property
+    def progress(self):
+        """Fraction of the current batch that has finished, 1.0 when nothing is loading."""
+        with self._lock:
+            if not self._batch_size:
+                return 1.0
+            return self._batch_finished / self._batch_size
+
+    @property
+    def done(self):
+        return not self._running
+
+    def wait(self):
+        """Block until every job so far has finished."""
+        with self._lock:
+            running = list(self._running)
+        wait(running)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _finished(self, future):
+        with self._lock:
+            self._running.discard(future)
+            self._batch_finished += 1
+            if not self._running:
+                self._batch_size = self._batch_finished = 0
+        if not future.cancelled() and future.exception() is not None:
+            # The owner gets the exception again from result(), this only makes background failures visible
+            self.log.error("Background load failed: %s", future.exception())
+
+
+# Shared by the asset registry, the sound bank and the music player
+loader = AssetLoader()
@@ -0,0 +1,91 @@
+from collections import OrderedDict
+
+from config import ASSET_MEMORY_BUDGET
+from logger_config import logger
+
+from .disk_cache import disk_cache
+from .loader import loader
+
+
+class AssetRegistry:
+    """
+    Loads every image file once and shares the resulting surface between all users.
+
+    acquire() hands out the shared surface and bumps its reference count, release() drops it again.
+    Unreferenced surfaces stay cached for the next acquire until the cache grows past memory_budget,
+    at which point the least recently released ones are evicted. preload() starts decoding a file on the
+    background loader, the first acquire() of it then only waits for that one file.
+    """
+    def __init__(self, memory_budget=ASSET_MEMORY_BUDGET):
+        self.log = logger.getChild(__name__)
+        self.memory_budget = memory_budget
+        self._surfaces = {}
+        self._refcounts = {}
+        self._unreferenced = OrderedDict()  # eviction candidates, least recently released first
+        self._cached_bytes = 0
+        self._pending = {}  # {(path, alpha): Future} decodes started by preload()
+
+    def preload(self, path, alpha=False):
+        """Start decoding path in the background unless it is already loaded or loading."""
+        key = (path, alpha)
+        if key not in self._surfaces and key not in self._pending:
+            self._pending[key] = loader.submit(disk_cache.load_image, path, alpha)
+
+    def acquire(self, path, alpha=False):
+        """Shared surface for path, converted to the display format once a display exists."""
+        key = (path, alpha)
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = self._load(path, alpha)
+            self._surfaces[key] = surface
+            self._refcounts[key] = 0
+            self._cached_bytes += self._size_of(surface)
+        self._refcounts[key] += 1
+        self._unreferenced.pop(key, None)
+        return surface
+
+    def release(self, path, alpha=False):
+        key = (path, alpha)
+        if self._refcounts.get(key, 0) <= 0:
+            self.log.error("Released %s more times than it was acquired", path)
+            return
+        self._refcounts[key] -= 1
+        if self._refcounts[key] == 0:
+            self._unreferenced[key] = None
+            self._evict()
+
+    def refcount(self, path, alpha=False):
+        return self._refcounts.get((path, alpha), 0)
+
+    @property
+    def cached_bytes(self):
+        return self._cached_bytes
+
+    def clear(self):
+        """Drop every unreferenced surface regardless of the budget."""
+        while self._unreferenced:
+            self._drop(self._unreferenced.popitem(last=False)[0])
+
+    def _evict(self):
+        while self._cached_bytes > self.memory_budget and self._unreferenced:
+            self._drop(self._unreferenced.popitem(last=False)[0])
+
+    def _drop(self, key):
+        surface = self._surfaces.pop(key)
+        del self._refcounts[key]
+        self._cached_bytes -= self._size_of(surface)
+        self.log.debug("Evicted %s", key[0])
+
+    def _load(self, path, alpha):
+        future = self._pending.pop((path, alpha), None)
+        if future is not None:
+            return future.result()
+        return disk_cache.load_image(path, alpha)
+
+    @staticmethod
+    def _size_of(surface):
+        return surface.get_pitch() * surface.get_height()
+
+
+# Shared by every scene, sprite and Pokemon
+registry = AssetRegistry()
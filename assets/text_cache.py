@@ -0,0 +1,63 @@
+from collections import OrderedDict
+
+import pygame
+
+from config import TEXT_ALPHA_STEP, TEXT_CACHE_SIZE, TEXT_SCALE_STEP
+
+
+def quantize_scale(scale, step=TEXT_SCALE_STEP):
+    """Snap an animated text scale to a fixed step so scaled sizes hit the cache."""
+    return round(scale / step) * step
+
+
+def quantize_alpha(alpha, step=TEXT_ALPHA_STEP):
+    if alpha >= 255:
+        return 255
+    return max(0, int(alpha) // step * step)
+
+
+class TextCache:
+    """
+    Shares Font objects per (path, size, bold) and keeps rendered text surfaces in an LRU.
+
+    Rendered surfaces are shared between callers, so they must be treated as read only; faded text is
+    requested through the alpha argument instead of calling set_alpha() on the result.
+    """
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._fonts = {}
+        self._rendered = OrderedDict()
+
+    def font(self, path, size, bold=False):
+        """Shared font, path None is pygame's default font."""
+        key = (path, size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(path, size)
+            font.set_bold(bold)
+            self._fonts[key] = font
+        return font
+
+    def render(self, text, size, color, path=None, bold=False, antialias=True, alpha=None):
+        if alpha is not None:
+            alpha = quantize_alpha(alpha)
+        key = (path, size, bold, text, tuple(color), antialias, alpha)
+        surface = self._rendered.get(key)
+        if surface is not None:
+            self._rendered.move_to_end(key)
+            return surface
+
+        surface = self.font(path, size, bold).render(text, antialias, color)
+        if alpha is not None:
+            surface.set_alpha(alpha)
+        self._rendered[key] = surface
+        if len(self._rendered) > self.max_entries:
+            self._rendered.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._rendered.clear()
+
+
+# Shared by every scene
+text_cache = TextCache()
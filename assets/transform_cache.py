@@ -0,0 +1,58 @@
+import weakref
+
+import pygame
+
+
+class TransformCache:
+    """
+    Derived variants (flipped, greyscale, tinted, scaled) of source surfaces, built once per operation.
+
+    Entries are keyed weakly by the source surface so they disappear with it; call invalidate() after
+    drawing onto a source in place. Variants are shared and must be treated as read only.
+    """
+    def __init__(self):
+        self._variants = weakref.WeakKeyDictionary()  # {source: {operation: surface}}
+
+    def _get(self, source, operation, build):
+        variants = self._variants.get(source)
+        if variants is None:
+            variants = self._variants[source] = {}
+        surface = variants.get(operation)
+        if surface is None:
+            surface = variants[operation] = build()
+        return surface
+
+    def flipped(self, source, flip_x, flip_y=False):
+        return self._get(source, ('flip', flip_x, flip_y), lambda: pygame.transform.flip(source, flip_x, flip_y))
+
+    def greyscale(self, source):
+        def build():
+            surface = pygame.transform.grayscale(source)
+            surface.set_colorkey(source.get_colorkey())
+            return surface
+        return self._get(source, ('greyscale',), build)
+
+    def tinted(self, source, color, special_flags=pygame.BLEND_RGB_ADD):
+        """Copy of source blended with color, e.g. a white flash for blinking hits."""
+        def build():
+            surface = source.copy()
+            surface.fill(color, special_flags=special_flags)
+            colorkey = source.get_colorkey()
+            if colorkey is not None:
+                # Put the transparent pixels back so the tint keeps the sprite's outline
+                pygame.mask.from_surface(source).to_surface(surface, setcolor=None, unsetcolor=colorkey)
+            return surface
+        return self._get(source, ('tint', tuple(color), special_flags), build)
+
+    def scaled(self, source, size):
+        return self._get(source, ('scale', tuple(size)), lambda: pygame.transform.scale(source, size))
+
+    def invalidate(self, source):
+        self._variants.pop(source, None)
+
+    def clear(self):
+        self._variants.clear()
+
+
+# Shared by every scene
+transforms = TransformCache()
@@ -1,41 +1,41 @@
 import pygame
-import time
+
+from audio.music_player import MusicPlayer
+from audio.sound_bank import SoundBank
+from config import MUSIC_PREFETCH, SOUND_CHANNELS, SOUND_EFFECTS
 
 class AudioManager:
     def __init__(self):
         pygame.mixer.init()
-        self._current_track = None
+        self.sounds = SoundBank()
+        self.sounds.preload(SOUND_EFFECTS)
+
+        # Music gets the two channels after the sound effects' ones
+        self.music = MusicPlayer(SOUND_CHANNELS)
+        for track in MUSIC_PREFETCH:
+            self.music.prefetch(track)
+        # Only recorded once a switch really happened, a track that fails to decode never becomes current
+        self.music.on_switch = self._music_switched
         self._previous_track = None
-        self._pending_track = None
-        self._fade_complete_time = None
 
     def play_music(self, track_path, loop=True, fadeout_ms=0, volume=1.0):
-        if self._current_track == track_path:
+        """Switch tracks, crossfading over fadeout_ms. Returns at once, the decode runs in the background."""
+        if track_path == (self.music.pending or self.music.current):
             return
+        self.music.play(track_path, loop, fadeout_ms, volume)
 
-        if self._current_track != track_path:
-            self._previous_track = self._current_track
-
-        if fadeout_ms > 0 and pygame.mixer.music.get_busy():
-            pygame.mixer.music.fadeout(fadeout_ms)
-            self._pending_track = (track_path, loop, volume)
-            self._fade_complete_time = pygame.time.get_ticks() + fadeout_ms
-            return
+    def _music_switched(self, previous, current):
+        self._previous_track = previous
 
-        self._start_music(track_path, loop, volume)
-
-    def _start_music(self, track_path, loop, volume):
-        pygame.mixer.music.load(track_path)
-        pygame.mixer.music.set_volume(volume)
-        pygame.mixer.music.play(-1 if loop else 0)
-        self._current_track = track_path
-        self._pending_track = None
-        self._fade_complete_time = None
+    def play_sound(self, name, priority=0):
+        return self.sounds.play(name, priority)
 
     def update_music(self):
-        if self._pending_track and pygame.time.get_ticks() >= self._fade_complete_time:
-            track_path, loop, volume = self._pending_track
-            self._start_music(track_path, loop, volume)
+        self.music.update()
+
+    def close(self):
+        self.music.close()
+        self.sounds.stop()
 
     def resume_previous_music(self, fadeout_ms=0):
         if self._previous_track:
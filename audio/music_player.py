@@ -0,0 +1,116 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from assets.disk_cache import disk_cache
+from assets.loader import loader, lower_thread_priority
+from config import MUSIC_CACHE_TRACKS
+from logger_config import logger
+
+
+class MusicPlayer:
+    """
+    Background music on two mixer channels so one track can fade out while the next fades in.
+
+    Tracks are decoded into Sounds on a worker thread and the last cache_size are kept (a decoded track
+    is roughly 10 MB per minute). play() never waits for the decoder: the old track keeps playing until
+    the new one is ready, so prefetched tracks switch on the same frame and the others a little later.
+    """
+    def __init__(self, first_channel, cache_size=MUSIC_CACHE_TRACKS):
+        self.log = logger.getChild(__name__)
+        self.cache_size = cache_size
+
+        if pygame.mixer.get_num_channels() < first_channel + 2:
+            pygame.mixer.set_num_channels(first_channel + 2)
+        self._channels = [pygame.mixer.Channel(first_channel), pygame.mixer.Channel(first_channel + 1)]
+        self._active = 0  # channel of the current track
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='music-decode',
+                                            initializer=lower_thread_priority)
+        self._decoded = OrderedDict()  # {path: Sound}
+        self._loading = {}  # {path: Future}
+        self._pending = None  # (path, loop, fade_ms, volume) waiting for its decode
+        self.current = None
+        self.on_switch = None  # on_switch(previous, current) once a track has actually started
+
+    def prefetch(self, path):
+        """Start decoding a track that is likely to be played soon."""
+        if path not in self._decoded and path not in self._loading:
+            self._loading[path] = loader.track(self._executor.submit(disk_cache.load_sound, path))
+
+    @property
+    def pending(self):
+        """Path of the track waiting for its decode, None when there is none."""
+        return self._pending[0] if self._pending is not None else None
+
+    def play(self, path, loop=True, fade_ms=0, volume=1.0):
+        """Crossfade to path over fade_ms as soon as it is decoded."""
+        if path == self.current:
+            # Back to the track that is still playing, whatever was waiting for its decode is dropped
+            self._pending = None
+            return
+        self.prefetch(path)
+        self._pending = (path, loop, fade_ms, volume)
+        self.update()
+
+    def update(self):
+        """Start the pending track once its decode has finished, call once per frame."""
+        if self._pending is None:
+            return
+        path, loop, fade_ms, volume = self._pending
+        sound = self._ready(path)
+        if sound is None:
+            return
+        self._pending = None
+
+        outgoing = self._channels[self._active]
+        self._active ^= 1
+        incoming = self._channels[self._active]
+        if fade_ms:
+            outgoing.fadeout(fade_ms)
+        else:
+            outgoing.stop()
+        incoming.set_volume(volume)
+        incoming.play(sound, loops=-1 if loop else 0, fade_ms=fade_ms)
+        previous, self.current = self.current, path
+        if self.on_switch is not None:
+            self.on_switch(previous, path)
+
+    def _ready(self, path):
+        """Decoded Sound of path, None while it is still decoding."""
+        sound = self._decoded.get(path)
+        if sound is not None:
+            self._decoded.move_to_end(path)
+            return sound
+
+        future = self._loading.get(path)
+        if future is None or not future.done():
+            return None
+        del self._loading[path]
+        try:
+            sound = future.result()
+        except Exception as e:
+            # Any failure of the background decode only cancels the switch, the current track keeps playing
+            self.log.error("Could not decode %s: %s", path, e)
+            self._pending = None
+            return None
+
+        self._decoded[path] = sound
+        # A Sound that is still playing stays alive on its channel after it leaves the cache
+        while len(self._decoded) > self.cache_size:
+            self._decoded.popitem(last=False)
+        return sound
+
+    def stop(self, fade_ms=0):
+        self._pending = None
+        for channel in self._channels:
+            if fade_ms:
+                channel.fadeout(fade_ms)
+            else:
+                channel.stop()
+        self.current = None
+
+    def close(self):
+        self.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,90 @@
+import threading
+
+import pygame
+
+from assets.disk_cache import disk_cache
+from assets.loader import loader
+from config import SOUND_CHANNELS, SOUND_MAX_VOICES
+from logger_config import logger
+
+
+class SoundBank:
+    """
+    Decodes each sound effect once and plays it by name on a fixed pool of mixer channels.
+
+    When every channel is busy the lowest priority (then oldest) voice is stolen, provided it does not
+    outrank the new sound, and a single effect never holds more than max_voices channels.
+    """
+    def __init__(self, channels=SOUND_CHANNELS, max_voices=SOUND_MAX_VOICES):
+        self.log = logger.getChild(__name__)
+        self.max_voices = max_voices
+        self._sounds = {}
+        self._paths = {}
+        self._lock = threading.Lock()
+        self._preload = None
+
+        pygame.mixer.set_num_channels(channels)
+        self._channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self._voices = {}  # {channel_index: (name, priority, started_at)}
+
+    def preload(self, effects, background=True):
+        """Decode {name: path} effects up front, on the background asset loader unless background is False."""
+        self._paths.update(effects)
+        if not background:
+            self._load_all(effects)
+            return
+        self._preload = loader.submit(self._load_all, dict(effects))
+
+    def wait(self):
+        """Block until a background preload has finished."""
+        if self._preload is not None:
+            self._preload.result()
+            self._preload = None
+
+    def _load_all(self, effects):
+        for name, path in effects.items():
+            self.get(name)
+
+    def get(self, name):
+        sound = self._sounds.get(name)
+        if sound is None:
+            # Only a cold effect waits here, and only on whoever is decoding it
+            with self._lock:
+                sound = self._sounds.get(name)
+                if sound is None:
+                    sound = disk_cache.load_sound(self._paths[name])
+                    self._sounds[name] = sound
+        return sound
+
+    def play(self, name, priority=0):
+        """Play the named effect, returns the channel used or None if it was dropped."""
+        sound = self.get(name)
+        now = pygame.time.get_ticks()
+
+        # Forget voices whose channel has finished
+        for index in list(self._voices):
+            if not self._channels[index].get_busy():
+                del self._voices[index]
+
+        same = sorted((v[2], i) for i, v in self._voices.items() if v[0] == name)
+        if len(same) >= self.max_voices:
+            # Restart the oldest copy instead of stacking another one
+            index = same[0][1]
+        else:
+            index = next((i for i in range(len(self._channels)) if i not in self._voices), None)
+        if index is None:
+            index, victim = min(self._voices.items(), key=lambda item: (item[1][1], item[1][2]))
+            if victim[1] > priority:
+                self.log.debug("Dropped %s, all channels busy with higher priority sounds", name)
+                return None
+
+        channel = self._channels[index]
+        channel.stop()
+        channel.play(sound)
+        self._voices[index] = (name, priority, now)
+        return channel
+
+    def stop(self):
+        for channel in self._channels:
+            channel.stop()
+        self._voices.clear()
@@ -0,0 +1,212 @@
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import combinations_with_replacement
+
+from combat.engine import BattleEngine, Combatant
+from pokemon.definedenemies import EnemyEnum
+from pokemon.definedjobs import JobEnum
+
+COLUMNS = ['enemy', 'party', 'chunk', 'battles', 'victories', 'defeats', 'timeouts',
+           'total_turns', 'total_damage_dealt', 'total_damage_taken']
+# Arguments that change what a row means, stored next to the results so a resume only mixes matching rows
+RUN_PARAMETERS = ['battles', 'chunk_size', 'seed', 'max_turns', 'vectorized']
+IN_FLIGHT_PER_WORKER = 2  # work units queued per worker, so an interrupt only has a few to cancel
+
+
+def party_compositions(max_size=4):
+    """Every party of 1..max_size members drawn from JobEnum (order does not matter, jobs may repeat)."""
+    jobs = [job.name for job in JobEnum]
+    for size in range(1, max_size + 1):
+        yield from combinations_with_replacement(jobs, size)
+
+
+def work_units(max_size, battles, chunk_size):
+    """(enemy, party, chunk, battles) units covering every composition against every enemy."""
+    for enemy in EnemyEnum:
+        for party in party_compositions(max_size):
+            for chunk, start in enumerate(range(0, battles, chunk_size)):
+                yield enemy.name, '+'.join(party), chunk, min(chunk_size, battles - start)
+
+
+def chunk_seed(seed, enemy, party, chunk):
+    return random.Random(f"{seed}:{enemy}:{party}:{chunk}").getrandbits(64)
+
+
+def build_battlers(enemy, party):
+    members = party.split('+')
+    battlers = [Combatant.from_job(JobEnum[job].value, name=f"{job}{i}") for i, job in enumerate(members)]
+    return Combatant.from_enemy_job(EnemyEnum[enemy].value), battlers
+
+
+def run_unit(enemy, party, chunk, battles, seed, max_turns, vectorized):
+    """Resolve one chunk of battles in a worker process and return its CSV row."""
+    unit_seed = chunk_seed(seed, enemy, party, chunk)
+    if vectorized:
+        from combat.montecarlo import DEFEAT, VICTORY, simulate
+        result = simulate(*build_battlers(enemy, party), battles, seed=unit_seed, max_turns=max_turns)
+        victories = int((result.outcome == VICTORY).sum())
+        defeats = int((result.outcome == DEFEAT).sum())
+        turns = int(result.turns.sum())
+        dealt = int(result.damage_dealt.sum())
+        taken = int(result.damage_taken.sum())
+    else:
+        rng = random.Random(unit_seed)
+        victories = defeats = turns = dealt = taken = 0
+        for _ in range(battles):
+            result = BattleEngine(*build_battlers(enemy, party), rng).resolve(max_turns)
+            victories += result.outcome == 'victory'
+            defeats += result.outcome == 'defeat'
+            turns += result.turns
+            dealt += result.damage_dealt
+            taken += result.damage_taken
+
+    return [enemy, party, chunk, battles, victories, defeats, battles - victories - defeats, turns, dealt, taken]
+
+
+def parameters_path(path):
+    return path + '.params.json'
+
+
+def check_parameters(path, args):
+    """
+    Compare the run parameters of an earlier sweep into path with this one, writing them for a new sweep.
+    Returns an error message when they differ, None when the results can be resumed.
+    """
+    params = {name: getattr(args, name) for name in RUN_PARAMETERS}
+    has_results = os.path.exists(path) and os.path.getsize(path) > 0
+    if has_results and not args.restart:
+        try:
+            with open(parameters_path(path)) as f:
+                previous = json.load(f)
+        except (OSError, ValueError):
+            return f"{path} has no readable {parameters_path(path)}, pass --restart to discard its results"
+        if previous != params:
+            changed = ', '.join(f"{name} {previous.get(name)} -> {params[name]}" for name in RUN_PARAMETERS
+                                if previous.get(name) != params[name])
+            return f"{path} was written with different parameters ({changed}), pass --restart to discard it"
+        return None
+
+    if os.path.exists(path):
+        os.remove(path)
+    with open(parameters_path(path), 'w') as f:
+        json.dump(params, f)
+    return None
+
+
+def repair_results(path):
+    """Cut off a row torn by an interrupted write, rows only count once their newline is on disk."""
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb+') as f:
+        data = f.read()
+        end = data.rfind(b'\n') + 1
+        if end < len(data):
+            f.truncate(end)
+            print(f"Dropped an incomplete row at the end of {path}", file=sys.stderr)
+
+
+def result_rows(path):
+    """Complete rows of a results file, rows with missing or non-numeric fields are skipped."""
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            try:
+                yield {**row, **{column: int(row[column]) for column in COLUMNS[2:]}}
+            except (TypeError, ValueError):
+                continue
+
+
+def completed_units(path):
+    """Units already written by an earlier (possibly interrupted) run of the same sweep."""
+    if not os.path.exists(path):
+        return set()
+    return {(row['enemy'], row['party'], row['chunk']) for row in result_rows(path)}
+
+
+def summarize(path):
+    """Aggregate the chunk rows of a results file per matchup."""
+    totals = {}
+    for row in result_rows(path):
+        key = (row['enemy'], row['party'])
+        acc = totals.setdefault(key, [0, 0, 0])
+        acc[0] += row['battles']
+        acc[1] += row['victories']
+        acc[2] += row['total_turns']
+    return {key: (battles, victories / battles, turns / battles) for key, (battles, victories, turns) in totals.items()}
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Headless balance sweep of every party composition against every enemy.")
+    parser.add_argument('--out', default='logs/balance_sweep.csv', help="results file, resumed if it already exists")
+    parser.add_argument('--battles', type=int, default=10000, help="battles per matchup")
+    parser.add_argument('--chunk-size', type=int, default=2000, help="battles per work unit")
+    parser.add_argument('--party-size', type=int, default=4, help="largest party to enumerate")
+    parser.add_argument('--max-turns', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--vectorized', action='store_true', help="resolve chunks with the NumPy simulator")
+    parser.add_argument('--restart', action='store_true', help="discard existing results instead of resuming them")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.makedirs(os.path.dirname(args.out) or '.', exist_ok=True)
+
+    error = check_parameters(args.out, args)
+    if error:
+        print(error, file=sys.stderr)
+        return 2
+    repair_results(args.out)
+
+    done = completed_units(args.out)
+    units = [u for u in work_units(args.party_size, args.battles, args.chunk_size) if u[:3] not in done]
+    total = len(units) + len(done)
+    print(f"{len(done)}/{total} work units already in {args.out}, {len(units)} to run on {args.workers} workers",
+          file=sys.stderr)
+
+    new_file = not os.path.exists(args.out) or os.path.getsize(args.out) == 0
+    start = time.perf_counter()
+    with open(args.out, 'a', newline='') as f, ProcessPoolExecutor(max_workers=args.workers) as pool:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(COLUMNS)
+
+        pending = iter(units)
+        running = set()
+        finished = len(done)
+        try:
+            while True:
+                # Only a bounded batch is ever queued, the rest is submitted as units finish
+                for unit in pending:
+                    running.add(pool.submit(run_unit, *unit, args.seed, args.max_turns, args.vectorized))
+                    if len(running) >= args.workers * IN_FLIGHT_PER_WORKER:
+                        break
+                if not running:
+                    break
+                completed, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    # Rows are flushed as they arrive so an interrupted sweep resumes from here
+                    writer.writerow(future.result())
+                    f.flush()
+                    finished += 1
+                    print(f"\r{finished}/{total} work units ({time.perf_counter() - start:.1f}s)", end='',
+                          file=sys.stderr)
+        except KeyboardInterrupt:
+            pool.shutdown(wait=False, cancel_futures=True)
+            print(f"\nInterrupted, partial results kept in {args.out}", file=sys.stderr)
+            return 1
+    print(file=sys.stderr)
+
+    for (enemy, party), (battles, win_rate, mean_turns) in sorted(summarize(args.out).items()):
+        print(f"{enemy:10} {party:35} battles={battles:<8} win_rate={win_rate:.4f} mean_turns={mean_turns:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
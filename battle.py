@@ -2,14 +2,24 @@ import pygame
 import pygame_gui
 import random
 
+from assets import quantize_scale, registry, text_cache, transforms
+from combat.engine import BattleEngine
 from config import *
-from logger_config import logger
+from diagnostics import profiler
+from scenes.scene import Scene
+from world import merge_rects
 
-class Battle:
-    def __init__(self, game, enemy, party):
-        self.log = logger.getChild(__name__)
+class Battle(Scene):
+    """
+    Presentation layer over BattleEngine: UI, animations, popups and sounds.
 
-        self.game = game
+    Pushed as a scene by Game.start_battle(), it pops itself when the fight is over and reports the
+    outcome ('victory', 'escape' or 'defeat') to Game.end_battle().
+    """
+    assets = ('img/pokemon_battle_bg.png',)
+
+    def __init__(self, game, enemy, party, rng=None):
+        Scene.__init__(self, game)
         self.enemy = enemy
         self.party = party
 
@@ -19,30 +29,28 @@ class Battle:
         )
         self.manager.clear_and_reset()
 
-        self.battle_background = pygame.image.load('./img/pokemon_battle_bg.png')
-
-        # Audio
-        self.hit_sound = pygame.mixer.Sound('audio/sounds/attack_hit.mp3')
-        self.crit_sound = pygame.mixer.Sound('audio/sounds/attack_crit.mp3')
-        self.miss_sound = pygame.mixer.Sound('audio/sounds/attack_miss.mp3')
-        self.run_sound = pygame.mixer.Sound('audio/sounds/run.mp3')
+        self.battle_background = registry.acquire('img/pokemon_battle_bg.png')
 
-        # Turn order setup
-        self.battlers = [self.enemy] + self.party.members
-        for battler in self.battlers:
-            battler.initiative = battler.agl + random.randint(0, 49)
-        self.turn_order = sorted(self.battlers, key=lambda b: b.initiative, reverse=True)
+        # Combat rules and turn order live in the engine
+        self.engine = BattleEngine(self.enemy, self.party.members, rng)
 
         self.damage_popups = []  # stores damage/miss popups
         self.hit_effects = {} # {battler_obj: {"timer": ms_remaining, "blink": bool}}
         self.attack_animations = {}  # {battler_obj: {"timer": ms_remaining, "forward": bool}}
 
-        self.current_turn_index = 0
-        self.active_battler = self.turn_order[self.current_turn_index]
         self.running = True
 
-        self.state = 'action_select' # action_select target_select or enemy_turn
-        self.target = None
+        self.state = 'action_select' # action_select target_select enemy_turn, then victory or defeat
+
+        # Cached backdrop (background + resting battlers) and what was drawn over it last frame
+        self.backdrop = None
+        self._backdrop_key = None
+        self._overlay_rects = []
+        self._full_redraw = True
+        self._ui_signature = None
+        self._ui_dirty_frames = 0
+        self._object_ids = {}  # last object id applied per UI element
+        self.exp_texts = []  # shown under the victory message
 
         # Build the UI
         self._build_ui()
@@ -50,13 +58,29 @@ class Battle:
         self.enemy_turn_timer = 0
 
         # Ensure enemy starts if they win initiative
-        if self.active_battler == self.enemy:
+        if self.engine.is_enemy_turn():
             self.state = "enemy_turn"
             self.pick_enemy_target()
             self.enemy_turn_timer = 1000
 
         self.update_button_states()
 
+    @property
+    def turn_order(self):
+        return self.engine.turn_order
+
+    @property
+    def active_battler(self):
+        return self.engine.active_battler
+
+    @property
+    def target(self):
+        return self.engine.target
+
+    @target.setter
+    def target(self, target):
+        self.engine.target = target
+
     def _build_ui(self):
         # Panel for battle menu
         box_height = 150
@@ -135,47 +159,33 @@ class Battle:
             container=self.menu_panel
         )
 
+    def _set_object_id(self, element, object_id):
+        """Re-theme a UI element only when its object id actually changes."""
+        if self._object_ids.get(element) != object_id:
+            element.change_object_id(object_id)
+            self._object_ids[element] = object_id
+
     def update_name_highlight(self):
-        # Clear all highlights first
-        self.enemy_label.change_object_id('')
-        for lbl in self.party_labels:
-            lbl.change_object_id('')
-        # Highlight active battler if alive
-        if self.active_battler == self.enemy and self.enemy.current_health > 0:
-            self.enemy_label.change_object_id('#highlighted_text')
-        else:
-            for i, pokemon in enumerate(self.party.members):
-                if self.active_battler == pokemon and pokemon.current_health > 0:
-                    self.party_labels[i].change_object_id('#highlighted_text')
-
-        # Flash target
-        if self.target:
-            flash_on = (pygame.time.get_ticks() // 250) % 2 == 0  # toggle every 250ms
-            obj_id = '#red_highlighted_text' if flash_on else ''
-            if self.enemy == self.target:
-                self.enemy_label.change_object_id(obj_id)
-            for i, pokemon in enumerate(self.party.members):
-                if pokemon == self.target:
-                    self.party_labels[i].change_object_id(obj_id)
+        labels = [(self.enemy, self.enemy_label)] + list(zip(self.party.members, self.party_labels))
+        flash_on = (pygame.time.get_ticks() // 250) % 2 == 0  # toggle every 250ms
+
+        for battler, label in labels:
+            if battler.current_health <= 0:
+                obj_id = '#gray_text'  # KO'd labels stay greyed out
+            elif self.target and battler == self.target:
+                # Flash target
+                obj_id = '#red_highlighted_text' if flash_on else ''
+            elif battler == self.active_battler:
+                # Highlight active battler
+                obj_id = '#highlighted_text'
+            else:
+                obj_id = ''
+            self._set_object_id(label, obj_id)
 
     def next_turn(self):
-        # Store current battler
-        current_battler = self.active_battler
-
-        # Remove KO'd battlers from turn order
-        self.turn_order = [b for b in self.turn_order if b.current_health > 0]
-
-        # Find the new index of the current battler (if still alive)
-        if current_battler in self.turn_order:
-            current_index = self.turn_order.index(current_battler)
-            self.current_turn_index = (current_index + 1) % len(self.turn_order)
-        else:
-            # If current battler died (unlikely for enemy's own turn), just reset index
-            self.current_turn_index = 0
-
-        self.active_battler = self.turn_order[self.current_turn_index]
+        self.engine.next_turn()
 
-        if self.active_battler == self.enemy:
+        if self.engine.is_enemy_turn():
             self.state = "enemy_turn"
             self.pick_enemy_target()
             self.enemy_turn_timer = 1000
@@ -186,19 +196,11 @@ class Battle:
 
     def pick_enemy_target(self):
         """Choose a target for the enemy and highlight them."""
-        valid_targets = [p for p in self.party.members if p.current_health > 0]
-        if not valid_targets:
+        event = self.engine.pick_enemy_target()
+        if not event:
             return
 
-        weights = [0.5, 0.25, 0.125, 0.125]
-        weights = weights[:len(valid_targets)]
-        total = sum(weights)
-        norm_weights = [w / total for w in weights]
-
-        target = random.choices(valid_targets, weights=norm_weights, k=1)[0]
-        self.target = target
-
-        self.log.debug(f"{self.enemy.name} prepares to attack {target.name}!")
+        self.log.debug("%s prepares to attack %s!", self.enemy.name, event.target.name)
 
     def start_target_select(self):
         """Switch to target selection UI for the player."""
@@ -206,8 +208,8 @@ class Battle:
         self.update_button_states()
 
         if self.enemy.current_health > 0:
-            self.target = self.enemy
-            self.log.debug(f"{self.active_battler.name} is targeting {self.enemy.name} - Press Enter to confirm.")
+            self.engine.select_target(self.enemy)
+            self.log.debug("%s is targeting %s - Press Enter to confirm.", self.active_battler.name, self.enemy.name)
         else:
             self.log.error("No valid targets.")
             self.next_turn()
@@ -219,60 +221,47 @@ class Battle:
             self.target = None
             return
 
-        num_attacks = self.active_battler.get_number_of_attacks()
-
-        for i in range(num_attacks):
+        for event in self.engine.perform_attack():
             # Trigger slide animation for the attacker
-            self.attack_animations[self.active_battler] = {
+            self.attack_animations[event.attacker] = {
                 "timer": 200,  # total animation duration (ms)
                 "forward": True  # currently moving forward
             }
 
-            # Calculate accuracy
-            hit_rate = 168
-            acc_check = random.randint(0, 200)
-            hit = acc_check <= min(hit_rate + self.active_battler.acc, 255) - self.target.eva
-            crit = acc_check == 0 or acc_check < self.active_battler.crit
-            if hit:
-                self.log.debug(f"{self.active_battler.name} hit {self.target.name}!")
+            crit = event.crit
+            if event.hit:
+                self.log.debug("%s hit %s for %d dmg, %d HP left", event.attacker.name, event.target.name,
+                               event.damage, event.remaining_health)
 
                 # Trigger shake/blink effect
-                self.hit_effects[self.target] = {
+                self.hit_effects[event.target] = {
                     "timer": 600 if crit else 300,  # ms
                     "blink": True,
                     "shake": 8 if crit else 4,  # px
                     "blink_speed": 30 if crit else 50  # ms toggle
                 }
 
-                # Calculate damage
-                dmg = self.active_battler.str // 2
-                if crit:
-                    dmg *= 2
-                print("Doing " + str(dmg) + " dmg")
-                self.target.current_health -= dmg
-                self.target.current_health = max(0, self.target.current_health)
-                print("New current_health " + str(self.target.current_health))
-                popup_text = str(int(dmg))
+                popup_text = str(int(event.damage))
                 popup_color = (255, 255, 0) if crit else (255, 0, 0)  # yellow for crits, red otherwise
 
                 if crit:
-                    self.crit_sound.play()
+                    self.game.audio.play_sound('attack_crit', priority=2)
                 else:
-                    self.hit_sound.play()
+                    self.game.audio.play_sound('attack_hit', priority=1)
             else:
-                self.log.debug(f"{self.active_battler.name} missed {self.target.name}!")
+                self.log.debug("%s missed %s!", event.attacker.name, event.target.name)
                 popup_text = "Miss!"
                 popup_color = (200, 200, 200)
 
-                self.miss_sound.play()
+                self.game.audio.play_sound('attack_miss')
 
             # Determine popup position based on target sprite
-            if self.target == self.enemy:
+            if event.target == self.enemy:
                 pos_x = 50 + self.enemy.image.get_width() // 2
                 pos_y = SCREEN_HEIGHT // 2 - 32
             else:
-                target_index = self.party.members.index(self.target)
-                pos_x = SCREEN_WIDTH - 80 + self.target.image.get_width() // 2
+                target_index = self.party.members.index(event.target)
+                pos_x = SCREEN_WIDTH - 80 + event.target.image.get_width() // 2
                 pos_y = (80 + target_index * 70) - 10
 
             # Store popup
@@ -287,74 +276,129 @@ class Battle:
                 "crit": crit
             })
 
-        self.target = None
         self.next_turn()
 
-    def draw_battle_screen(self):
-        self.update_health_bar_colors()
-        # Draw background
-        self.game.screen.blit(self.battle_background, (0, 0))
-
-        # Draw enemy sprite with effects
-        enemy_x, enemy_y = 50, SCREEN_HEIGHT // 2 - 32
-        if self.enemy in self.attack_animations:
-            if self.attack_animations[self.enemy]["forward"]:
-                enemy_x += 10  # slide forward
-            else:
-                enemy_x -= 0  # could add slight recoil if wanted
-
-        if self.enemy in self.hit_effects:
-            effect = self.hit_effects[self.enemy]
-            enemy_x += random.randint(-effect["shake"], effect["shake"])
-            enemy_y += random.randint(-effect["shake"], effect["shake"])
-            if int(pygame.time.get_ticks() / effect["blink_speed"]) % 2 == 0:
-                self.game.screen.blit(pygame.transform.flip(self.enemy.image, True, False), (enemy_x, enemy_y))
+    def rest_position(self, battler):
+        """Where a battler stands when it is not attacking or being hit."""
+        if battler == self.enemy:
+            return 50, SCREEN_HEIGHT // 2 - 32
+        return SCREEN_WIDTH - 80, 80 + self.party.members.index(battler) * 70
+
+    def battler_image(self, battler):
+        if battler == self.enemy:
+            return transforms.flipped(self.enemy.image, True)
+        if battler.current_health <= 0:
+            # Greyscale copy, the original keeps its colors
+            return transforms.greyscale(battler.image)
+        return battler.image
+
+    def _build_backdrop(self, animated):
+        """Background plus every battler that is standing still this frame."""
+        if self.backdrop is None:
+            self.backdrop = self.battle_background.copy()
         else:
-            self.game.screen.blit(pygame.transform.flip(self.enemy.image, True, False), (enemy_x, enemy_y))
-
-        # Draw party sprites with effects
-        for i, pokemon in enumerate(self.party.members):
-            y = 80 + i * 70
-            x = SCREEN_WIDTH - 80
-            sprite = pokemon.image
-            if pokemon.current_health <= 0:
-                # Convert to greyscale
-                arr = pygame.surfarray.pixels3d(sprite)
-                avg = arr.mean(axis=2, dtype=int)
-                arr[:, :, 0] = avg
-                arr[:, :, 1] = avg
-                arr[:, :, 2] = avg
-                del arr  # unlock surface
-
-            if pokemon in self.attack_animations:
-                if self.attack_animations[pokemon]["forward"]:
-                    x -= 10  # slide toward enemy
-                else:
-                    x += 0
-            if pokemon in self.hit_effects:
-                effect = self.hit_effects[pokemon]
+            self.backdrop.blit(self.battle_background, (0, 0))
+        for battler in [self.enemy] + self.party.members:
+            if battler not in animated:
+                self.backdrop.blit(self.battler_image(battler), self.rest_position(battler))
+
+    def _overlays(self, animated):
+        """(image, screen rect) of everything drawn over the backdrop this frame."""
+        overlays = []
+        for battler in [self.enemy] + self.party.members:
+            if battler not in animated:
+                continue
+            x, y = self.rest_position(battler)
+            if battler in self.attack_animations and self.attack_animations[battler]["forward"]:
+                x += 10 if battler == self.enemy else -10  # slide toward the other side
+            if battler in self.hit_effects:
+                effect = self.hit_effects[battler]
                 x += random.randint(-effect["shake"], effect["shake"])
                 y += random.randint(-effect["shake"], effect["shake"])
-                if int(pygame.time.get_ticks() / effect["blink_speed"]) % 2 == 0:
-                    self.game.screen.blit(pokemon.image, (x, y))
-            else:
-                self.game.screen.blit(pokemon.image, (x, y))
+                if int(pygame.time.get_ticks() / effect["blink_speed"]) % 2 != 0:
+                    continue  # blinked out this frame
+            image = self.battler_image(battler)
+            overlays.append((image, image.get_rect(topleft=(x, y))))
 
-        # Draw damage popups
+        # Damage popups
         for popup in self.damage_popups:
             font_size = 48 if popup["crit"] else 32
-            font = pygame.font.Font(None, int(font_size * popup["scale"]))  # scale font size
-            if popup["crit"]:
-                font.set_bold(True)
-
-            text_surf = font.render(popup["text"], True, popup["color"])
-            text_surf.set_alpha(popup["alpha"])
-            rect = text_surf.get_rect(center=(popup["x"], popup["y"]))
-            self.game.screen.blit(text_surf, rect)
+            size = int(font_size * quantize_scale(popup["scale"]))  # scale font size
+            text_surf = text_cache.render(popup["text"], size, popup["color"], bold=popup["crit"],
+                                          alpha=popup["alpha"])
+            overlays.append((text_surf, text_surf.get_rect(center=(popup["x"], popup["y"]))))
+        return overlays
+
+    def _current_ui_signature(self):
+        flash_on = (pygame.time.get_ticks() // 250) % 2 == 0 if self.target else None
+        health = tuple(b.current_health for b in [self.enemy] + self.party.members)
+        return (self.state, self.active_battler, self.target, flash_on, health,
+                self.manager.get_hovering_any_element())
+
+    def invalidate_screen(self):
+        """Repaint and push the whole window on the next draw."""
+        self._full_redraw = True
+
+    def draw_battle_screen(self, full=False):
+        """
+        Composite the cached backdrop with only the animated battlers and popups on top.
+
+        Only regions covered by overlays this frame or last frame are repainted and pushed to the display,
+        and the UI panel only when its state changed, so idle frames do almost no work.
+        """
+        self.update_health_bar_colors()
+        screen = self.game.screen
+
+        animated = frozenset(b for b in [self.enemy] + self.party.members
+                             if b in self.attack_animations or b in self.hit_effects)
+        key = (animated, tuple(b.current_health <= 0 for b in self.party.members))
+        if key != self._backdrop_key:
+            self._build_backdrop(animated)
+            self._backdrop_key = key
+            full = True
+
+        overlays = self._overlays(animated)
+        rects = [rect for _, rect in overlays]
+
+        # Keep redrawing the UI for a couple of frames after a change so themes can settle
+        signature = self._current_ui_signature()
+        if signature != self._ui_signature:
+            self._ui_signature = signature
+            self._ui_dirty_frames = 2
+        panel_rect = self.menu_panel.get_abs_rect()
+
+        if full or self._full_redraw:
+            screen.blit(self.backdrop, (0, 0))
+            for image, rect in overlays:
+                screen.blit(image, rect)
+            dirty = None
+            ui_dirty = True
+        else:
+            dirty = merge_rects(self._overlay_rects + rects)
+            ui_dirty = self._ui_dirty_frames > 0 or panel_rect.collidelist(dirty) != -1
+            if ui_dirty:
+                # The panel is translucent, so it is redrawn over a fresh copy of what lies beneath
+                dirty = merge_rects(dirty + [panel_rect])
+            for area in dirty:
+                screen.set_clip(area)
+                screen.blit(self.backdrop, area, area)
+                for image, rect in overlays:
+                    if rect.colliderect(area):
+                        screen.blit(image, rect)
+            screen.set_clip(None)
+        self._overlay_rects = rects
+        self._full_redraw = False
 
         # Draw UI
-        self.manager.draw_ui(self.game.screen)
-        pygame.display.update()
+        if ui_dirty:
+            self.manager.draw_ui(screen)
+            self._ui_dirty_frames = max(0, self._ui_dirty_frames - 1)
+
+        with profiler.phase('flip'):
+            if dirty is None:
+                pygame.display.update()
+            elif dirty:
+                pygame.display.update(dirty)
 
     def update_health_bar_colors(self):
         """Change health bar color based on HP percentage."""
@@ -362,16 +406,16 @@ class Battle:
         def set_bar_color(bar, hp, label):
             if hp <= 0:
                 # KO: grey out sprite and label
-                bar.change_object_id('#gray_bar')
-                label.change_object_id('#gray_text')
+                self._set_object_id(bar, '#gray_bar')
+                self._set_object_id(label, '#gray_text')
             else:
                 hp_percent = bar.health_percentage
                 if hp_percent > 0.5:
-                    bar.change_object_id('#green_bar')
+                    self._set_object_id(bar, '#green_bar')
                 elif hp_percent > 0.25:
-                    bar.change_object_id('#yellow_bar')
+                    self._set_object_id(bar, '#yellow_bar')
                 else:
-                    bar.change_object_id('#red_bar')
+                    self._set_object_id(bar, '#red_bar')
 
         # Enemy bar
         set_bar_color(self.enemy_health_bar, self.enemy.current_health, self.enemy_label)
@@ -393,20 +437,20 @@ class Battle:
             if button == self.attack_button:
                 self.start_target_select()
             elif button == self.item_button:
-                self.log.debug(f"{self.active_battler.name} chose Item")
+                self.log.debug("%s chose Item", self.active_battler.name)
                 self.next_turn()
             elif button == self.equip_button:
-                self.log.debug(f"{self.active_battler.name} chose Equip")
+                self.log.debug("%s chose Equip", self.active_battler.name)
                 self.next_turn()
             elif button == self.run_button:
                 # if self.active_battler.lck > self.active_battler.lvl + 15:
                 if True:
-                    self.log.debug(f"{self.active_battler.name} ran from battle")
-                    self.run_sound.play()
+                    self.log.debug("%s ran from battle", self.active_battler.name)
+                    self.game.audio.play_sound('run', priority=3)
                     self.game.audio.resume_previous_music()
                     self.running = False
                 else:
-                    self.log.debug(f"{self.active_battler.name} failed to run from battle")
+                    self.log.debug("%s failed to run from battle", self.active_battler.name)
                     self.next_turn()
         else:
             self.next_turn()
@@ -416,162 +460,170 @@ class Battle:
 
         # Clear lingering popups and effects
         self.cleanup()
-        self.draw_battle_screen()
-
-        # Create grey overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)  # transparency (0=transparent, 255=solid)
-        overlay.fill((50, 50, 50))  # grey color
-        self.game.screen.blit(overlay, (0, 0))
-
-        font = pygame.font.Font('ARCADECLASSIC.TTF', 72)
-        text_surf = font.render("Defeat", True, (255, 0, 0))
-        rect = text_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.game.screen.blit(text_surf, rect)
-
-        pygame.display.update()
-        # Wait for Enter key
-        waiting = True
-        while waiting:
-            self.game.audio.update_music()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.quit_game()
-                    return
-                elif event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                    waiting = False
+        # The message stays on screen until Enter is pressed
+        self.state = 'defeat'
+        self.draw_result_message()
 
     def display_victory_message(self):
         # Clear lingering popups and effects
         self.cleanup()
-        self.draw_battle_screen()
 
         self.game.audio.play_music('audio/music/Victory.mp3', fadeout_ms=FADEOUT_MS)
 
-        # Create grey overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)  # transparency
-        overlay.fill((50, 50, 50))
-        self.game.screen.blit(overlay, (0, 0))
-
-        font = pygame.font.Font('ARCADECLASSIC.TTF', 72)
-        text_surf = font.render("Victory!", True, (255, 215, 0))  # gold color
-        rect = text_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
-        self.game.screen.blit(text_surf, rect)
-
         # Award EXP to surviving party members
-        exp_texts = []
         exp_amount = getattr(self.enemy, "exp")
         for p in self.party.members:
             if p.current_health > 0:
                 p.exp += exp_amount
-                exp_texts.append(f"{p.name} gained {exp_amount} EXP")
-                self.log.debug(f"{p.name} gained {exp_amount} EXP")
+                self.exp_texts.append(f"{p.name} gained {exp_amount} EXP")
+                self.log.debug("%s gained %s EXP", p.name, exp_amount)
             else:
-                self.log.debug(f"{p.name} is KO'd and gained no EXP")
+                self.log.debug("%s is KO'd and gained no EXP", p.name)
+
+        # The message stays on screen until Enter is pressed
+        self.state = 'victory'
+        self.draw_result_message()
+
+    def draw_result_message(self):
+        """Paint the victory or defeat message over the battle, again whenever the screen was invalidated."""
+        self.draw_battle_screen(full=True)
+
+        # Create grey overlay
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        overlay.set_alpha(180)  # transparency (0=transparent, 255=solid)
+        overlay.fill((50, 50, 50))  # grey color
+        self.game.screen.blit(overlay, (0, 0))
+
+        if self.state == 'defeat':
+            text_surf = text_cache.render("Defeat", 72, (255, 0, 0), 'ARCADECLASSIC.TTF')
+            rect = text_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        else:
+            text_surf = text_cache.render("Victory!", 72, (255, 215, 0), 'ARCADECLASSIC.TTF')  # gold color
+            rect = text_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
+        self.game.screen.blit(text_surf, rect)
 
-        small_font = pygame.font.Font('ARCADECLASSIC.TTF', 28)
-        for i, line in enumerate(exp_texts):
-            exp_surf = small_font.render(line, True, (255, 255, 255))
+        for i, line in enumerate(self.exp_texts):
+            exp_surf = text_cache.render(line, 28, (255, 255, 255), 'ARCADECLASSIC.TTF')
             exp_rect = exp_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40 + i * 40))
             self.game.screen.blit(exp_surf, exp_rect)
 
         pygame.display.update()
 
-        # Wait for Enter key
-        waiting = True
-        while waiting:
-            self.game.audio.update_music()
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.quit_game()
-                    return
-                elif event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                    waiting = False
-
-        self.running = False
-        self.game.in_battle = False
-        self.game.audio.play_music('audio/music/Main Theme.mp3', fadeout_ms=FADEOUT_MS)
-
-    def run(self):
+    def enter(self):
         self.game.audio.play_music('audio/music/Battle.mp3', fadeout_ms=FADEOUT_MS)
 
-        while self.running:
-            self.game.audio.update_music()
-            time_delta = self.game.clock.tick(FPS) / 1000.0
-            ms_delta = time_delta * 1000
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.game.quit_game()
-                    return 'quit'
-
-                elif event.type == pygame.KEYDOWN and self.state == 'target_select':
-                    if event.key == pygame.K_RETURN:
-                        self.perform_attack()
-
-                if event.type == pygame_gui.UI_BUTTON_PRESSED:
-                    self.handle_button_press(event.ui_element)
-
-                self.manager.process_events(event)
-
-            # Handle delayed enemy turn
-            if self.state == "enemy_turn" and self.enemy_turn_timer > 0:
-                self.enemy_turn_timer -= ms_delta
-                if self.enemy_turn_timer <= 0:
-                    self.perform_attack()
-
-            # Update damage popups
-            for popup in self.damage_popups[:]:
-                popup["y"] -= 0.5  # move up slowly
-                popup["lifetime"] -= time_delta * 1000
-                popup["alpha"] = max(0, int(255 * (popup["lifetime"] / 1000)))
-
-                # Bounce effect: shrink scale toward 1.0
-                if popup["scale"] > 1.0:
-                    popup["scale"] -= 0.05
-                    if popup["scale"] < 1.0:
-                        popup["scale"] = 1.0
-
-                if popup["lifetime"] <= 0:
-                    self.damage_popups.remove(popup)
-
-            # Update hit effects
-            for battler in list(self.hit_effects.keys()):
-                self.hit_effects[battler]["timer"] -= time_delta * 1000
-                if self.hit_effects[battler]["timer"] <= 0:
-                    del self.hit_effects[battler]
-
-            # Update attack animations
-            for battler in list(self.attack_animations.keys()):
-                anim = self.attack_animations[battler]
-                anim["timer"] -= time_delta * 1000
-                if anim["timer"] <= 100:
-                    anim["forward"] = False  # move back after halfway
-                if anim["timer"] <= 0:
-                    del self.attack_animations[battler]
-
-            self.manager.update(time_delta)
+    def exit(self):
+        # Every way off the stack lands here, finish() as well as SceneStack.clear() on quit or restart
+        self.cleanup()
+        self.release_assets()
+        self.backdrop = None
+
+    def invalidate(self):
+        self.invalidate_screen()
+
+    def finish(self, result):
+        """Leave the battle screen and hand the outcome back to the game."""
+        if result == 'victory':
+            self.game.audio.play_music('audio/music/Main Theme.mp3', fadeout_ms=FADEOUT_MS)
+        self.game.scenes.pop()
+        self.game.end_battle(self.enemy, result)
+
+    def handle_event(self, event):
+        if self.state in ('victory', 'defeat'):
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+                self.finish(self.state)
+            return
+
+        if event.type == pygame.KEYDOWN and self.state == 'target_select':
+            if event.key == pygame.K_RETURN:
+                self.perform_attack()
+
+        if event.type == pygame_gui.UI_BUTTON_PRESSED:
+            self.handle_button_press(event.ui_element)
+
+        self.manager.process_events(event)
+
+    def update(self, frame_ms):
+        if self.state in ('victory', 'defeat'):
+            return
+        if not self.running:
+            # Ran away
+            self.finish('escape')
+            return
+
+        with profiler.phase('battle.timers'):
+            self.update_timers(frame_ms)
+
+        with profiler.phase('battle.ui'):
+            self.manager.update(frame_ms / 1000.0)
             self.update_name_highlight()
-            self.draw_battle_screen()
             self.update_button_states()
 
-            # Check defeat condition
-            if all(p.current_health <= 0 for p in self.party.members):
-                self.display_defeat_message()
-                return 'defeat'
+    def update_timers(self, frame_ms):
+        """Advance the enemy turn delay, damage popups, hit effects and attack animations."""
+        # Handle delayed enemy turn
+        if self.state == "enemy_turn" and self.enemy_turn_timer > 0:
+            self.enemy_turn_timer -= frame_ms
+            if self.enemy_turn_timer <= 0:
+                self.perform_attack()
+
+        # Update damage popups
+        for popup in self.damage_popups[:]:
+            popup["y"] -= 0.5  # move up slowly
+            popup["lifetime"] -= frame_ms
+            popup["alpha"] = max(0, int(255 * (popup["lifetime"] / 1000)))
+
+            # Bounce effect: shrink scale toward 1.0
+            if popup["scale"] > 1.0:
+                popup["scale"] -= 0.05
+                if popup["scale"] < 1.0:
+                    popup["scale"] = 1.0
+
+            if popup["lifetime"] <= 0:
+                self.damage_popups.remove(popup)
+
+        # Update hit effects
+        for battler in list(self.hit_effects.keys()):
+            self.hit_effects[battler]["timer"] -= frame_ms
+            if self.hit_effects[battler]["timer"] <= 0:
+                del self.hit_effects[battler]
+
+        # Update attack animations
+        for battler in list(self.attack_animations.keys()):
+            anim = self.attack_animations[battler]
+            anim["timer"] -= frame_ms
+            if anim["timer"] <= 100:
+                anim["forward"] = False  # move back after halfway
+            if anim["timer"] <= 0:
+                del self.attack_animations[battler]
+
+    def draw(self):
+        if self.state in ('victory', 'defeat'):
+            # The result message was drawn once and stays up, until something like F3 invalidates the screen
+            if self._full_redraw:
+                self.draw_result_message()
+            return
 
-            # Check victory condition
-            if self.enemy.current_health <= 0:
-                self.display_victory_message()
-                return 'victory'
+        with profiler.phase('battle.screen'):
+            self.draw_battle_screen()
 
-        self.cleanup()
-        return 'escape'
+        # Check defeat condition
+        if self.engine.is_defeat():
+            self.display_defeat_message()
+
+        # Check victory condition
+        elif self.engine.is_victory():
+            self.display_victory_message()
 
     def cleanup(self):
         """Ensure no lingering UI elements or battle state."""
         self.manager.clear_and_reset()
         self.damage_popups.clear()
         self.hit_effects.clear()
-        self.attack_animations.clear()
\ No newline at end of file
+        self.attack_animations.clear()
+
+    def release_assets(self):
+        """Hand shared surfaces back to the asset registry once the battle screen is gone."""
+        if self.battle_background is not None:
+            registry.release('img/pokemon_battle_bg.png')
+            self.battle_background = None
\ No newline at end of file
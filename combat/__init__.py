@@ -0,0 +1 @@
+from .engine import BattleEngine, BattleResult, Combatant, AttackEvent, TargetEvent, TurnEvent
@@ -0,0 +1,206 @@
+import random
+from collections import namedtuple
+
+# Combat rules shared by the interactive Battle screen and headless tooling
+HIT_RATE = 168
+MAX_HIT_CHANCE = 255
+ACC_ROLL_MAX = 200
+INITIATIVE_ROLL_MAX = 49
+ENEMY_TARGET_WEIGHTS = [0.5, 0.25, 0.125, 0.125]
+
+# Pure data events produced while resolving a battle
+TurnEvent = namedtuple('TurnEvent', ['battler'])
+TargetEvent = namedtuple('TargetEvent', ['attacker', 'target'])
+AttackEvent = namedtuple('AttackEvent', ['attacker', 'target', 'hit', 'crit', 'damage', 'remaining_health'])
+
+BattleResult = namedtuple('BattleResult', ['outcome', 'turns', 'damage_dealt', 'damage_taken', 'events'])
+
+
+def party_member_attacks(acc, job_name):
+    """Number of strikes a party member lands per attack action."""
+    num_attacks = max(acc // 32, 1)
+    if job_name == 'Monk':
+        num_attacks *= 2
+    return num_attacks
+
+
+def party_member_crit(job_name, lvl):
+    """Crit threshold for a party member (determined by weapon, Monks get it from level)."""
+    return 0 if job_name != 'Monk' else lvl * 2
+
+
+def hit_threshold(acc, eva):
+    """Highest accuracy roll that still connects."""
+    return min(HIT_RATE + acc, MAX_HIT_CHANCE) - eva
+
+
+def attack_damage(str_, crit):
+    dmg = str_ // 2
+    if crit:
+        dmg *= 2
+    return dmg
+
+
+class Combatant:
+    """Plain stat block usable by the engine without any sprites or surfaces."""
+    def __init__(self, name, hp, str_, acc, eva, agl, crit=0, num_attacks=1):
+        self.name = name
+        self.str = str_
+        self.acc = acc
+        self.eva = eva
+        self.agl = agl
+        self.crit = crit
+        self.num_attacks = num_attacks
+        self.current_health = hp
+        self.health_capacity = hp
+        self.initiative = 0
+
+    @classmethod
+    def from_job(cls, job, name=None, lvl=1):
+        """Build a party member stat block from a Job."""
+        stats = job.get_base_stats()
+        return cls(name or job.name, stats['HP'], stats['STR'], stats['ACC'], stats['EVA'], stats['AGL'],
+                   crit=party_member_crit(job.name, lvl),
+                   num_attacks=party_member_attacks(stats['ACC'], job.name))
+
+    @classmethod
+    def from_enemy_job(cls, job, name=None):
+        """Build an enemy stat block from an EnemyEnum Job."""
+        stats = job.get_base_stats()
+        return cls(name or job.name, stats['HP'], stats['STR'], stats['ACC'], stats['EVA'], stats['AGL'])
+
+    def get_number_of_attacks(self):
+        return self.num_attacks
+
+
+class BattleEngine:
+    """
+    Resolves a battle between one enemy and a party as pure data.
+
+    Battlers only need the stat attributes used by the combat rules (name, agl, acc, eva, str, crit,
+    current_health and get_number_of_attacks()), so both Pokemon/Enemy sprites and Combatant stat
+    blocks work. All randomness comes from the injected rng so a seeded random.Random replays exactly.
+    """
+    def __init__(self, enemy, party_members, rng=None):
+        self.rng = rng if rng is not None else random.Random()
+        self.enemy = enemy
+        self.party_members = list(party_members)
+
+        # Turn order setup
+        self.battlers = [self.enemy] + self.party_members
+        for battler in self.battlers:
+            battler.initiative = battler.agl + self.rng.randint(0, INITIATIVE_ROLL_MAX)
+        self.turn_order = sorted(self.battlers, key=lambda b: b.initiative, reverse=True)
+
+        self.current_turn_index = 0
+        self.active_battler = self.turn_order[self.current_turn_index]
+        self.target = None
+
+    def is_enemy_turn(self):
+        return self.active_battler == self.enemy
+
+    def is_victory(self):
+        return self.enemy.current_health <= 0
+
+    def is_defeat(self):
+        return all(p.current_health <= 0 for p in self.party_members)
+
+    def is_over(self):
+        return self.is_victory() or self.is_defeat()
+
+    def next_turn(self):
+        """Advance to the next living battler and return a TurnEvent."""
+        current_battler = self.active_battler
+
+        # Remove KO'd battlers from turn order
+        self.turn_order = [b for b in self.turn_order if b.current_health > 0]
+
+        # Find the new index of the current battler (if still alive)
+        if current_battler in self.turn_order:
+            current_index = self.turn_order.index(current_battler)
+            self.current_turn_index = (current_index + 1) % len(self.turn_order)
+        else:
+            # If current battler died (unlikely for enemy's own turn), just reset index
+            self.current_turn_index = 0
+
+        self.active_battler = self.turn_order[self.current_turn_index]
+        return TurnEvent(self.active_battler)
+
+    def pick_enemy_target(self):
+        """Choose a weighted target for the enemy, returns a TargetEvent or None if the party is wiped."""
+        valid_targets = [p for p in self.party_members if p.current_health > 0]
+        if not valid_targets:
+            return None
+
+        weights = ENEMY_TARGET_WEIGHTS[:len(valid_targets)]
+        total = sum(weights)
+        norm_weights = [w / total for w in weights]
+
+        self.target = self.rng.choices(valid_targets, weights=norm_weights, k=1)[0]
+        return TargetEvent(self.enemy, self.target)
+
+    def select_target(self, target):
+        self.target = target
+        return TargetEvent(self.active_battler, target)
+
+    def perform_attack(self):
+        """Resolve every strike of the active battler on the current target and return the AttackEvents."""
+        attacker = self.active_battler
+        target = self.target
+        if not target or target.current_health <= 0:
+            self.target = None
+            return []
+
+        events = []
+        for _ in range(attacker.get_number_of_attacks()):
+            acc_check = self.rng.randint(0, ACC_ROLL_MAX)
+            hit = acc_check <= hit_threshold(attacker.acc, target.eva)
+            crit = acc_check == 0 or acc_check < attacker.crit
+            dmg = 0
+            if hit:
+                dmg = attack_damage(attacker.str, crit)
+                target.current_health = max(0, target.current_health - dmg)
+            events.append(AttackEvent(attacker, target, hit, crit, dmg, target.current_health))
+
+        self.target = None
+        return events
+
+    def take_turn(self):
+        """Auto-play the active battler's turn (party members always attack the enemy)."""
+        if self.is_enemy_turn():
+            target_event = self.pick_enemy_target()
+        else:
+            target_event = self.select_target(self.enemy)
+
+        events = [target_event] if target_event else []
+        events.extend(self.perform_attack())
+        if not self.is_over():
+            events.append(self.next_turn())
+        return events
+
+    def resolve(self, max_turns=1000, record_events=False):
+        """Play the battle out to the end and return a BattleResult."""
+        events = [] if record_events else None
+        damage_dealt = 0
+        damage_taken = 0
+        turns = 0
+
+        while not self.is_over() and turns < max_turns:
+            turn_events = self.take_turn()
+            turns += 1
+            for event in turn_events:
+                if isinstance(event, AttackEvent):
+                    if event.target == self.enemy:
+                        damage_dealt += event.damage
+                    else:
+                        damage_taken += event.damage
+            if record_events:
+                events.extend(turn_events)
+
+        if self.is_victory():
+            outcome = 'victory'
+        elif self.is_defeat():
+            outcome = 'defeat'
+        else:
+            outcome = 'timeout'
+        return BattleResult(outcome, turns, damage_dealt, damage_taken, events)
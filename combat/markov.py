@@ -0,0 +1,332 @@
+from collections import namedtuple
+from fractions import Fraction
+from itertools import permutations
+
+import numpy as np
+
+from combat.engine import ACC_ROLL_MAX, ENEMY_TARGET_WEIGHTS, INITIATIVE_ROLL_MAX, Combatant, hit_threshold
+
+MarkovResult = namedtuple('MarkovResult', ['victory', 'defeat', 'expected_turns'])
+MatchupRow = namedtuple('MatchupRow', ['job', 'enemy', 'lvl', 'victory', 'defeat', 'expected_turns'])
+
+# Seconds allowed per party size by the timing check below: the solo table over levels 1-10, the first jobs
+# of JobEnum as a party otherwise, against every enemy
+TIMING_BUDGET_S = {1: 1.0, 2: 1.0, 3: 3.0, 4: 30.0}
+
+
+def win_probability(enemy, party_members, exact=False):
+    """
+    Exact outcome of an auto-played battle (see BattleEngine.resolve()) by evaluating its Markov chain.
+
+    States are the HP of every battler at the start of the enemy's turn, averaged over every initiative order
+    weighted by its probability. expected_turns is inf when the battle can go on forever (nobody can deal damage).
+    Pass exact=True to get Fractions instead of floats, expected_turns is then None for a never-ending battle.
+    """
+    calculator = _MarkovCalculator(enemy, party_members, exact)
+    return calculator.solve()
+
+
+def matchup_table(jobs, enemies, levels=(1,), exact=False):
+    """Solo win probabilities for every job x enemy x level, e.g. matchup_table(JobEnum, EnemyEnum, range(1, 11))."""
+    rows = []
+    for enemy in enemies:
+        for job in jobs:
+            for lvl in levels:
+                result = win_probability(Combatant.from_enemy_job(enemy.value),
+                                         [Combatant.from_job(job.value, lvl=lvl)], exact)
+                rows.append(MatchupRow(job.name, enemy.name, lvl, *result))
+    return rows
+
+
+def initiative_order_probabilities(agilities, exact=False):
+    """
+    Probability of every turn order produced by sorting agl + randint(0, 49) descending (ties keep battler order).
+
+    Returns {order_tuple: probability}, computed per permutation by a running sum over initiative values.
+    """
+    one = Fraction(1) if exact else 1.0
+    roll_p = one / (INITIATIVE_ROLL_MAX + 1)
+    low = min(agilities)
+    high = max(agilities) + INITIATIVE_ROLL_MAX
+    values = range(low, high + 1)
+
+    def density(battler):
+        agl = agilities[battler]
+        return [roll_p if agl <= v <= agl + INITIATIVE_ROLL_MAX else 0 for v in values]
+
+    densities = [density(b) for b in range(len(agilities))]
+    orders = {}
+    for order in permutations(range(len(agilities))):
+        chain = densities[order[0]]
+        for prev, battler in zip(order, order[1:]):
+            # Mass of the previous battler rolling strictly higher, or equal when it wins the tie on index
+            above = [0] * len(values)
+            running = 0
+            for i in reversed(range(len(values))):
+                above[i] = running + (chain[i] if prev < battler else 0)
+                running += chain[i]
+            chain = [d * a for d, a in zip(densities[battler], above)]
+        p = sum(chain)
+        if p:
+            orders[order] = p
+    return orders
+
+
+class _MarkovCalculator:
+    """
+    The battle as rounds: the enemy attacks, then every living party member strikes it in turn order.
+
+    Whether a round kills the enemy only depends on the summed damage of the living members, so states are
+    the HP vectors at the start of the enemy's turn and victory and defeat do not depend on the turn order
+    at all. Only the number of turns does (members after the killing blow never act), so those are kept
+    as a vector with one entry per turn cycle. Enemy attacks, party damage and states are shared by every
+    initiative order of the matchup.
+    """
+    def __init__(self, enemy, party_members, exact):
+        self.battlers = [enemy] + list(party_members)
+        self.num_party = len(party_members)
+        self.exact = exact
+        self.one = Fraction(1) if exact else 1.0
+        self.zero = self.one * 0
+        self.dtype = object if exact else float  # of the turn vectors
+        # Expected turns of a battle that can never end, absorbs every sum it takes part in
+        self.never = None if exact else float('inf')
+
+        self.start = tuple(b.current_health for b in self.battlers)
+        self.cycles = []  # party members in turn order after the enemy, one per distinct rotation
+        self.strike_tables = {}
+        self.enemy_attacks = {}
+        self.party_damage = {}
+        self.segment_turns = {}
+        self.segment_vectors = {}
+        self.after_attack = {}  # {(enemy HP, party HP): (victory, defeat, turns)} once the enemy has attacked
+        self.memo = {}  # {hp: (victory, defeat, turns per cycle or never)} at the start of the enemy's turn
+
+    def solve(self):
+        agilities = [b.agl for b in self.battlers]
+        # Rotations of an order share a turn cycle, the members in front of the enemy only open the battle
+        starts = []
+        cycle_index = {}
+        for order, p in initiative_order_probabilities(agilities, self.exact).items():
+            shift = order.index(0)
+            cycle = order[shift + 1:] + order[:shift]
+            if cycle not in cycle_index:
+                cycle_index[cycle] = len(self.cycles)
+                self.cycles.append(cycle)
+            starts.append((order[:shift], cycle_index[cycle], p))
+
+        enemy_hp, party_hp = self.start[0], self.start[1:]
+        victory = defeat = expected_turns = self.zero
+        for openers, cycle, p in starts:
+            # The members rolling above the enemy strike before its first turn
+            killed, survived = self._party_damage(enemy_hp, openers)
+            v, d, t = killed, self.zero, self._turns_before_kill(enemy_hp, openers)
+            for hp, q in survived.items():
+                next_v, next_d, next_t = self._evaluate((hp,) + party_hp)
+                v += q * next_v
+                d += q * next_d
+                t = self._add_turns(t, q, next_t if next_t is self.never else next_t[cycle])
+            victory += p * v
+            defeat += p * d
+            expected_turns = self._add_turns(expected_turns, p, t)
+        if expected_turns is not self.never and not self.exact:
+            expected_turns = float(expected_turns)
+        return MarkovResult(victory, defeat, expected_turns)
+
+    def _strike_outcomes(self, attacker, target):
+        """Per-strike {damage: probability} for attacker hitting target."""
+        key = (attacker, target)
+        if key not in self.strike_tables:
+            a = self.battlers[attacker]
+            rolls = ACC_ROLL_MAX + 1
+            top = min(hit_threshold(a.acc, self.battlers[target].eva), ACC_ROLL_MAX)
+            hits = max(0, top + 1)
+            crits = min(hits, max(a.crit, 1))
+            dmg = a.str // 2
+            outcomes = {}
+            for damage, count in ((0, rolls - hits), (dmg, hits - crits), (dmg * 2, crits)):
+                if count:
+                    outcomes[damage] = outcomes.get(damage, self.zero) + self.one * count / rolls
+            # Every strike of a multi-hit attack rolls independently
+            total = {0: self.one}
+            for _ in range(a.get_number_of_attacks()):
+                step = {}
+                for so_far, p in total.items():
+                    for damage, q in outcomes.items():
+                        step[so_far + damage] = step.get(so_far + damage, self.zero) + p * q
+                total = step
+            self.strike_tables[key] = total
+        return self.strike_tables[key]
+
+    def _enemy_attack(self, party_hp):
+        """(defeat, {party_hp after the attack: probability}) for the enemy's turn, cached per party HP."""
+        if party_hp in self.enemy_attacks:
+            return self.enemy_attacks[party_hp]
+
+        alive = [i for i in range(self.num_party) if party_hp[i] > 0]
+        weights = ENEMY_TARGET_WEIGHTS[:len(alive)]
+        if self.exact:
+            weights = [Fraction(w) for w in weights]
+        total = sum(weights)
+
+        defeat = self.zero
+        outcomes = {}
+        for member, w in zip(alive, weights):
+            for damage, p in self._strike_outcomes(0, member + 1).items():
+                next_hp = list(party_hp)
+                next_hp[member] = max(0, party_hp[member] - damage)
+                next_hp = tuple(next_hp)
+                p = p * w / total
+                if any(next_hp):
+                    outcomes[next_hp] = outcomes.get(next_hp, self.zero) + p
+                else:
+                    defeat += p
+        self.enemy_attacks[party_hp] = (defeat, outcomes)
+        return defeat, outcomes
+
+    def _party_damage(self, enemy_hp, members):
+        """(victory, {enemy HP left: probability}) after members strike an enemy with enemy_hp, in any order."""
+        key = (enemy_hp, members)
+        if key in self.party_damage:
+            return self.party_damage[key]
+
+        # Damage past the enemy's HP is capped, a capped total means the enemy died
+        totals = {0: self.one}
+        for member in members:
+            step = {}
+            for so_far, p in totals.items():
+                for damage, q in self._strike_outcomes(member, 0).items():
+                    dealt = min(so_far + damage, enemy_hp)
+                    step[dealt] = step.get(dealt, self.zero) + p * q
+            totals = step
+        victory = totals.pop(enemy_hp, self.zero)
+        result = (victory, {enemy_hp - dealt: p for dealt, p in totals.items()})
+        self.party_damage[key] = result
+        return result
+
+    def _turns_before_kill(self, enemy_hp, members):
+        """Expected turns taken by members striking in this order, the ones after the killing blow never act."""
+        key = (enemy_hp, members)
+        if key not in self.segment_turns:
+            turns = self.zero
+            for j in range(len(members)):
+                # Member j acts when the ones before it left the enemy alive
+                killed, _ = self._party_damage(enemy_hp, tuple(sorted(members[:j])))
+                turns += self.one - killed
+            self.segment_turns[key] = turns
+        return self.segment_turns[key]
+
+    def _after_attack(self, enemy_hp, party_hp, skip=None):
+        """
+        Value once the enemy's attack left party_hp: the living members strike, then the enemy's next turn.
+        Leaves out the next turn in state skip, the caller solves that self-loop itself.
+        """
+        key = (enemy_hp, party_hp)
+        if key in self.after_attack:
+            return self.after_attack[key]
+
+        living = tuple(i + 1 for i in range(self.num_party) if party_hp[i] > 0)
+        victory, survived = self._party_damage(enemy_hp, living)
+        defeat = self.zero
+        turns = self._segment_turns(enemy_hp, living)
+        complete = True
+        for enemy_left, q in survived.items():
+            hp = (enemy_left,) + party_hp
+            if hp == skip:
+                complete = False
+                continue
+            next_v, next_d, next_t = self.memo[hp]
+            victory += q * next_v
+            defeat += q * next_d
+            turns = self._add_turns(turns, q, next_t)
+
+        if complete:
+            self.after_attack[key] = (victory, defeat, turns)
+        return victory, defeat, turns
+
+    def _segment_turns(self, enemy_hp, living):
+        """Expected turns of the living members striking once, per cycle."""
+        key = (enemy_hp, living)
+        if key not in self.segment_vectors:
+            self.segment_vectors[key] = np.array(
+                [self._turns_before_kill(enemy_hp, tuple(m for m in cycle if m in living)) for cycle in self.cycles],
+                dtype=self.dtype)
+        return self.segment_vectors[key]
+
+    def _add_turns(self, total, p, turns):
+        """total + p * turns for expected turns (or vectors of them, one per cycle) that may be never."""
+        if total is self.never or turns is self.never:
+            return self.never
+        return total + p * turns
+
+    def _evaluate(self, start):
+        """Solve the enemy's turn in state start, walking successor states with an explicit stack."""
+        stack = [(start, False)]
+        while stack:
+            hp, expanded = stack.pop()
+            if hp in self.memo:
+                continue
+            enemy_hp, party_hp = hp[0], hp[1:]
+            defeat, attacks = self._enemy_attack(party_hp)
+            if expanded:
+                # Every successor above it on the stack has been solved by now
+                self.memo[hp] = self._solve_state(hp, defeat, attacks)
+                continue
+
+            stack.append((hp, True))
+            # HP never goes up, the only way back to hp is a round where neither side deals damage
+            stack.extend((next_hp, False) for next_party in attacks if (enemy_hp, next_party) not in self.after_attack
+                         for next_hp in ((enemy_left,) + next_party
+                                         for enemy_left in self._surviving_hp(enemy_hp, next_party))
+                         if next_hp != hp and next_hp not in self.memo)
+        return self.memo[start]
+
+    def _surviving_hp(self, enemy_hp, party_hp):
+        """{enemy HP left: probability} after the living members of party_hp strike."""
+        living = tuple(i + 1 for i in range(self.num_party) if party_hp[i] > 0)
+        return self._party_damage(enemy_hp, living)[1]
+
+    def _solve_state(self, hp, defeat, attacks):
+        """X = stay * X + rest for the enemy's turn in hp, where stay is the chance nothing changes."""
+        enemy_hp, party_hp = hp[0], hp[1:]
+        victory = self.zero
+        turns = np.full(len(self.cycles), self.one, dtype=self.dtype)  # the enemy's turn itself
+        stay = self.zero
+        for next_party, p in attacks.items():
+            next_v, next_d, next_t = self._after_attack(enemy_hp, next_party, skip=hp)
+            victory += p * next_v
+            defeat += p * next_d
+            turns = self._add_turns(turns, p, next_t)
+            if next_party == party_hp:
+                stay = p * self._surviving_hp(enemy_hp, party_hp).get(enemy_hp, self.zero)
+
+        # Checked on the outcomes rather than stay == 1, which rounding misses with floats
+        if not victory and not defeat and list(attacks) == [party_hp] and \
+                list(self._surviving_hp(enemy_hp, party_hp)) == [enemy_hp]:
+            return self.zero, self.zero, self.never
+        scale = 1 / (1 - stay)
+        turns = self.never if turns is self.never else turns * scale
+        return victory * scale, defeat * scale, turns
+
+
+if __name__ == "__main__":
+    # python -m combat.markov  fails when a party size goes over its TIMING_BUDGET_S
+    import sys
+    import time
+
+    from pokemon.definedenemies import EnemyEnum
+    from pokemon.definedjobs import JobEnum
+
+    over_budget = False
+    for size, budget in TIMING_BUDGET_S.items():
+        start = time.perf_counter()
+        if size == 1:
+            matchup_table(JobEnum, EnemyEnum, range(1, 11))
+        else:
+            jobs = list(JobEnum)[:size]
+            for enemy in EnemyEnum:
+                win_probability(Combatant.from_enemy_job(enemy.value), [Combatant.from_job(job.value) for job in jobs])
+        seconds = time.perf_counter() - start
+        over_budget |= seconds > budget
+        print(f"{size} member(s): {seconds:.3f} s (budget {budget} s)")
+    sys.exit(1 if over_budget else 0)
\ No newline at end of file
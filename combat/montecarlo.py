@@ -0,0 +1,169 @@
+import numpy as np
+
+from combat.engine import ACC_ROLL_MAX, ENEMY_TARGET_WEIGHTS, HIT_RATE, INITIATIVE_ROLL_MAX, MAX_HIT_CHANCE
+
+VICTORY = 1
+TIMEOUT = 0
+DEFEAT = -1
+
+
+class SimulationResult:
+    """Per-lane outcome arrays of a batch simulation plus the usual balancing summaries."""
+    def __init__(self, outcome, turns, damage_dealt, damage_taken):
+        self.outcome = outcome
+        self.turns = turns
+        self.damage_dealt = damage_dealt
+        self.damage_taken = damage_taken
+
+    def __len__(self):
+        return len(self.outcome)
+
+    @property
+    def win_rate(self):
+        return float(np.mean(self.outcome == VICTORY))
+
+    @property
+    def loss_rate(self):
+        return float(np.mean(self.outcome == DEFEAT))
+
+    @property
+    def turns_to_kill(self):
+        """Turn counts of the battles the party won."""
+        return self.turns[self.outcome == VICTORY]
+
+    def turn_distribution(self):
+        return np.bincount(self.turns)
+
+    def damage_taken_distribution(self):
+        return np.bincount(self.damage_taken)
+
+    def summary(self):
+        ttk = self.turns_to_kill
+        return {
+            "battles": len(self),
+            "win_rate": self.win_rate,
+            "loss_rate": self.loss_rate,
+            "mean_turns_to_kill": float(ttk.mean()) if len(ttk) else float('nan'),
+            "mean_damage_taken": float(self.damage_taken.mean()),
+        }
+
+
+def simulate(enemy, party_members, n, seed=None, max_turns=1000, batch_size=250_000):
+    """
+    Run n independent auto-played battles of enemy vs party_members, batch_size lanes at a time.
+
+    Replicates BattleEngine.resolve(): party members always attack the enemy, the enemy picks a weighted
+    target, multi-hit attacks keep striking a KO'd target and KO'd battlers drop out of the rotation.
+    Battlers are read once for their stats so Combatant stat blocks and sprites both work.
+    """
+    rng = np.random.default_rng(seed)
+    chunks = []
+    remaining = n
+    while remaining > 0:
+        lanes = min(batch_size, remaining)
+        chunks.append(_simulate_batch(enemy, party_members, lanes, rng, max_turns))
+        remaining -= lanes
+
+    return SimulationResult(*(np.concatenate([c[i] for c in chunks]) for i in range(4)))
+
+
+def _simulate_batch(enemy, party_members, n, rng, max_turns):
+    battlers = [enemy] + list(party_members)
+    num_battlers = len(battlers)
+    num_party = num_battlers - 1
+
+    str_ = np.array([b.str for b in battlers])
+    acc = np.array([b.acc for b in battlers])
+    eva = np.array([b.eva for b in battlers])
+    crit = np.array([b.crit for b in battlers])
+    agl = np.array([b.agl for b in battlers])
+    num_attacks = np.array([b.get_number_of_attacks() for b in battlers])
+    hit_cap = np.minimum(HIT_RATE + acc, MAX_HIT_CHANCE)
+    target_weights = np.array(ENEMY_TARGET_WEIGHTS[:num_party] + [0.0] * max(0, num_party - len(ENEMY_TARGET_WEIGHTS)))
+
+    # Battler columns are permuted into each lane's initiative order so turn rotation needs no gathers.
+    # Ties keep battler order like sorted(..., reverse=True).
+    initiative = agl + rng.integers(0, INITIATIVE_ROLL_MAX + 1, size=(n, num_battlers))
+    order = np.argsort(-initiative, axis=1, kind='stable')
+    column_of = np.argsort(order, axis=1)
+    hp = np.array([b.current_health for b in battlers], dtype=np.int32)[order]
+    position = np.zeros(n, dtype=np.int64)
+    party_alive = (hp > 0).sum(axis=1) - (hp[np.arange(n), column_of[:, 0]] > 0)
+    dealt = np.zeros(n, dtype=np.int64)
+    taken = np.zeros(n, dtype=np.int64)
+    lanes = np.arange(n)
+
+    outcome = np.zeros(n, dtype=np.int8)
+    turns = np.full(n, max_turns, dtype=np.int32)
+    damage_dealt = np.zeros(n, dtype=np.int64)
+    damage_taken = np.zeros(n, dtype=np.int64)
+
+    # State arrays only hold unfinished lanes and are compacted as battles end
+    for turn in range(1, max_turns + 1):
+        m = len(lanes)
+        if m == 0:
+            break
+        rows = np.arange(m)
+        hp_flat = hp.reshape(-1)
+        attacker = order.reshape(-1)[rows * num_battlers + position]
+        enemy_turn = attacker == 0
+
+        # Party members target the enemy, the enemy rolls against living party members
+        target = np.zeros(m, dtype=np.int64)
+        if enemy_turn.any():
+            enemy_rows = rows[enemy_turn]
+            alive = hp[enemy_rows[:, None], column_of[enemy_turn, 1:]] > 0
+            rank = np.cumsum(alive, axis=1) - 1
+            weights = np.where(alive, target_weights[np.clip(rank, 0, num_party - 1)], 0.0)
+            cum = np.cumsum(weights, axis=1)
+            roll = rng.random(len(cum)) * cum[:, -1]
+            picked = (cum <= roll[:, None]).sum(axis=1)
+            target[enemy_turn] = np.minimum(picked, num_party - 1) + 1
+
+        strikes = num_attacks[attacker]
+        threshold = hit_cap[attacker] - eva[target]
+        base_damage = str_[attacker] // 2
+        flat_target = rows * num_battlers + column_of.reshape(-1)[rows * num_battlers + target]
+        target_was_alive = hp_flat[flat_target] > 0
+        for strike in range(int(strikes.max())):
+            acc_check = rng.integers(0, ACC_ROLL_MAX + 1, size=m)
+            hit = (strike < strikes) & (acc_check <= threshold)
+            is_crit = (acc_check == 0) | (acc_check < crit[attacker])
+            dmg = base_damage * hit * (1 + is_crit)
+            hp_flat[flat_target] = np.maximum(0, hp_flat[flat_target] - dmg)
+            dealt += dmg * ~enemy_turn
+            taken += dmg * enemy_turn
+
+        knocked_out = target_was_alive & (hp_flat[flat_target] <= 0)
+        victory = knocked_out & ~enemy_turn
+        party_alive -= knocked_out & enemy_turn
+        defeat = party_alive <= 0
+        finished = victory | defeat
+        if finished.any():
+            done = lanes[finished]
+            outcome[done] = np.where(victory[finished], VICTORY, DEFEAT)
+            turns[done] = turn
+            damage_dealt[done] = dealt[finished]
+            damage_taken[done] = taken[finished]
+
+            keep = ~finished
+            lanes, hp, order, column_of = lanes[keep], hp[keep], order[keep], column_of[keep]
+            position, party_alive, dealt, taken = position[keep], party_alive[keep], dealt[keep], taken[keep]
+            m = len(lanes)
+            if m == 0:
+                break
+
+        # Rotate to the next living battler in initiative order, wrapping to the first living one
+        alive = hp > 0
+        after = np.full(m, -1)
+        first = np.full(m, -1)
+        for column in reversed(range(num_battlers)):
+            after = np.where(alive[:, column] & (position < column), column, after)
+            first = np.where(alive[:, column], column, first)
+        position = np.where(after >= 0, after, first)
+
+    # Lanes still fighting after max_turns time out
+    damage_dealt[lanes] = dealt
+    damage_taken[lanes] = taken
+
+    return outcome, turns, damage_dealt, damage_taken
@@ -3,15 +3,64 @@ import logging
 # logging
 LOG_LEVEL = logging.DEBUG
 LOG_FILE = 'logs/pokepy_debug.logs'
+LOG_ASYNC = True # log records are formatted and written to the file and console by a background thread
+LOG_RING_BUFFER = 0 # when set, keep this many records in memory and only write them out on ERROR or at exit
+LOG_LEVELS = {} # per-subsystem levels by module, e.g. {'battle': logging.INFO, 'world': logging.WARNING}
 
 # audio
 FADEOUT_MS = 150
+SOUND_CHANNELS = 8 # mixer channels shared by all sound effects
+SOUND_MAX_VOICES = 2 # simultaneous plays of the same effect
+MUSIC_CACHE_TRACKS = 4 # decoded music tracks kept in memory (about 10 MB per minute of music)
+MUSIC_PREFETCH = [ # decoded in the background at startup so these switches never wait
+    'audio/music/Prelude.mp3',
+    'audio/music/Main Theme.mp3',
+    'audio/music/Battle.mp3',
+    'audio/music/Menu Screen.mp3',
+]
+SOUND_EFFECTS = {
+    'attack_hit': 'audio/sounds/attack_hit.mp3',
+    'attack_crit': 'audio/sounds/attack_crit.mp3',
+    'attack_miss': 'audio/sounds/attack_miss.mp3',
+    'run': 'audio/sounds/run.mp3',
+}
+
+# profiling (F3 toggles the frame time overlay)
+PROFILER_ENABLED = False # collect frame phase timings from the start, not only while the overlay is shown
+PROFILER_WINDOW = 300 # frames in the overlay's rolling average and p99
+PROFILER_HISTOGRAM_BIN_MS = 0.5
+PROFILER_HISTOGRAM_BINS = 100 # frames slower than BINS * BIN_MS share the last bin
+PROFILER_EXPORT = 'logs/frame_times.csv' # histograms written on exit when timings were collected
+SPIKE_CAPTURE = False # sample the main thread's stacks and write a trace for every frame over budget
+SPIKE_BUDGET_MS = 50
+SPIKE_SAMPLE_MS = 2 # stack sampling interval
+SPIKE_KEEP = 20 # newest trace files kept in SPIKE_DIR, 0 keeps them all
+SPIKE_DIR = 'logs/spikes'
+STARTUP_BUDGET_MS = 1000 # launch to first frame, checked by python main.py --startup-report
+
+# assets
+ASSET_MEMORY_BUDGET = 64 * 1024 * 1024 # bytes of unreferenced surfaces kept cached
+TEXT_CACHE_SIZE = 256 # rendered text surfaces kept in the LRU
+TEXT_SCALE_STEP = 0.1 # popup scales snap to this step so sizes repeat
+TEXT_ALPHA_STEP = 16 # faded text alpha snaps to this step
+ASSET_DISK_CACHE = True # keep decoded images and sounds on disk so later launches skip decoding
+ASSET_CACHE_DIR = 'cache/assets'
+ASSET_CACHE_MAX_BYTES = 256 * 1024 * 1024 # least recently used entries are deleted past this
+ASSET_LOADER_WORKERS = 4 # threads decoding scene images and sound effects in the background from startup
 
 # display
 SCREEN_WIDTH = 640
 SCREEN_HEIGHT = 480
 TILESIZE = 32
-FPS = 60
+CHUNK_TILES = 16 # static terrain is baked into CHUNK_TILES x CHUNK_TILES surfaces
+CHUNK_LOAD_RADIUS = 1 # chunks kept loaded around the player when streaming a map file
+MAP_FILE = None # binary map (see world.map_file) streamed instead of tilemap when set
+FPS = 60 # render frame cap, 0 draws as fast as possible
+TICK_RATE = 60 # fixed simulation updates per second, speeds and animation steps are per tick
+TICK_MS = 1000 / TICK_RATE
+MAX_TICKS_PER_FRAME = 5 # catch-up limit after a slow frame, older backlog is dropped instead of spiralling
+DIRTY_RECT_RENDERING = False # push only changed screen regions while the camera is still
+ENTITY_STORE = False # keep overworld enemies in NumPy arrays, only on-screen ones become sprites (needs numpy)
 
 PLAYER_LAYER = 4
 ENEMY_LAYER = 3
@@ -0,0 +1,25 @@
+from .startup import StartupReport, startup
+
+# The profiler and spike watchdog pull in pygame and the asset caches, they are imported on first use so
+# the startup report can time those imports as well
+_LAZY = {
+    'FrameProfiler': 'profiler',
+    'profiler': 'profiler',
+    'SpikeWatchdog': 'spike_capture',
+    'spike_watchdog': 'spike_capture',
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Import statements go through builtins.__import__, where the startup report hooks in
+    # (importlib.import_module would bypass it). Importing .profiler bound the submodule as
+    # diagnostics.profiler, the singleton has to replace it.
+    if _LAZY[name] == 'profiler':
+        from .profiler import FrameProfiler, profiler
+        globals().update(FrameProfiler=FrameProfiler, profiler=profiler)
+    else:
+        from .spike_capture import SpikeWatchdog, spike_watchdog
+        globals().update(SpikeWatchdog=SpikeWatchdog, spike_watchdog=spike_watchdog)
+    return globals()[name]
\ No newline at end of file
@@ -0,0 +1,157 @@
+import csv
+from collections import deque
+from time import perf_counter
+
+import pygame
+
+from assets import text_cache
+from config import (PROFILER_ENABLED, PROFILER_EXPORT, PROFILER_HISTOGRAM_BIN_MS, PROFILER_HISTOGRAM_BINS,
+                    PROFILER_WINDOW, WHITE)
+from logger_config import logger
+
+OVERLAY_REFRESH_MS = 250
+OVERLAY_FONT_SIZE = 18
+OVERLAY_COLUMNS = (8, 128, 188)  # x of phase, avg and p99
+
+
+class _Phase:
+    """Adds the time spent inside a with-block to the current frame."""
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter()
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, perf_counter() - self.start)
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NO_PHASE = _NoPhase()
+
+
+class FrameProfiler:
+    """
+    Per-frame timings of named phases (events, update, draw, flip...), taken with `with profiler.phase(name):`.
+
+    Keeps the last window frames of every phase for the overlay (rolling average and p99) and a
+    histogram of the whole session that export() writes as CSV. While disabled, phase() hands out a
+    shared no-op context manager, so instrumented code costs one method call.
+    """
+    def __init__(self, window=PROFILER_WINDOW, bin_ms=PROFILER_HISTOGRAM_BIN_MS, bins=PROFILER_HISTOGRAM_BINS):
+        self.log = logger.getChild(__name__)
+        self.window = window
+        self.bin_ms = bin_ms
+        self.bins = bins
+        self.collect = PROFILER_ENABLED
+        self.show_overlay = False
+        self.enabled = self.collect
+
+        self._frame = {}  # {phase: seconds} of the frame in progress
+        self._frame_start = None
+        self._recent = {}  # {phase: deque of ms}
+        self._histograms = {}  # {phase: [frames per bin]}, the last bin holds everything slower
+        self._overlay = None
+        self._overlay_time = 0
+
+    def toggle_overlay(self):
+        """Show or hide the overlay, timings are collected while it is shown."""
+        self.show_overlay = not self.show_overlay
+        self.enabled = self.collect or self.show_overlay
+        self._overlay = None
+
+    def phase(self, name):
+        if not self.enabled:
+            return _NO_PHASE
+        return _Phase(self, name)
+
+    def add(self, name, seconds):
+        # A phase can run several times a frame (e.g. one flip per scene), the times add up
+        self._frame[name] = self._frame.get(name, 0) + seconds
+
+    def begin_frame(self):
+        if self.enabled:
+            self._frame_start = perf_counter()
+
+    def end_frame(self):
+        """Record the frame, returns its phase times in ms (None when disabled)."""
+        if not self.enabled or self._frame_start is None:
+            self._frame.clear()
+            return None
+
+        self._frame['frame'] = perf_counter() - self._frame_start
+        self._frame_start = None
+        times = {}
+        for name, seconds in self._frame.items():
+            ms = seconds * 1000
+            times[name] = ms
+            recent = self._recent.get(name)
+            if recent is None:
+                recent = self._recent[name] = deque(maxlen=self.window)
+                self._histograms[name] = [0] * (self.bins + 1)
+            recent.append(ms)
+            self._histograms[name][min(int(ms / self.bin_ms), self.bins)] += 1
+        self._frame.clear()
+        return times
+
+    def stats(self):
+        """{phase: (average ms, p99 ms)} over the rolling window."""
+        stats = {}
+        for name, recent in self._recent.items():
+            ordered = sorted(recent)
+            stats[name] = (sum(ordered) / len(ordered), ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))])
+        return stats
+
+    def draw_overlay(self, surface):
+        """Blit the stats panel in the top left corner, returns its rect."""
+        now = pygame.time.get_ticks()
+        if self._overlay is None or now - self._overlay_time >= OVERLAY_REFRESH_MS:
+            self._overlay = self._build_overlay()
+            self._overlay_time = now
+        return surface.blit(self._overlay, (0, 0))
+
+    def _build_overlay(self):
+        # Rendered straight from the font, changing numbers would only churn the text cache
+        font = text_cache.font(None, OVERLAY_FONT_SIZE)
+        rows = [('phase', 'avg ms', 'p99 ms')]
+        for name, (avg, p99) in sorted(self.stats().items()):
+            rows.append((name, f"{avg:.2f}", f"{p99:.2f}"))
+
+        line_height = font.get_linesize()
+        panel = pygame.Surface((OVERLAY_COLUMNS[-1] + 64, len(rows) * line_height + 8))
+        panel.fill((0, 0, 0))
+        for i, row in enumerate(rows):
+            for x, text in zip(OVERLAY_COLUMNS, row):
+                panel.blit(font.render(text, True, WHITE), (x, 4 + i * line_height))
+        return panel
+
+    def export(self, path=PROFILER_EXPORT):
+        """Write the session histograms as CSV rows of phase, bin range (ms) and frame count."""
+        if not self._histograms:
+            return
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['phase', 'min_ms', 'max_ms', 'frames'])
+            for name, counts in sorted(self._histograms.items()):
+                for i, count in enumerate(counts):
+                    if count:
+                        low = i * self.bin_ms
+                        high = (i + 1) * self.bin_ms if i < self.bins else ''
+                        writer.writerow([name, low, high, count])
+        self.log.info("Frame time histograms written to %s", path)
+
+
+# Shared by the main loop and the scenes
+profiler = FrameProfiler()
@@ -0,0 +1,122 @@
+import os
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+from time import perf_counter, sleep
+
+from config import SPIKE_BUDGET_MS, SPIKE_DIR, SPIKE_KEEP, SPIKE_SAMPLE_MS
+from logger_config import logger
+
+PREFIX = 'spike-'
+
+
+class SpikeWatchdog:
+    """
+    Catches frames that blow the time budget together with what the game was doing during them.
+
+    Once started, a daemon thread samples the main thread's call stack every sample_ms while a frame
+    is in progress. Frames over budget_ms get a timestamped trace file with the folded stacks
+    (`frame;frame;frame count`, root first, flamegraph friendly) and the profiler's phase times,
+    only the newest keep files are kept (all of them when keep <= 0). Samples of frames within budget are thrown away.
+    """
+    def __init__(self, budget_ms=SPIKE_BUDGET_MS, sample_ms=SPIKE_SAMPLE_MS, keep=SPIKE_KEEP, directory=SPIKE_DIR):
+        self.log = logger.getChild(__name__)
+        self.budget_ms = budget_ms
+        self.sample_ms = sample_ms
+        self.keep = keep
+        self.directory = directory
+
+        self._thread = None
+        self._stopped = threading.Event()
+        self._target = None  # ident of the thread running the frames
+        self._samples = None  # stacks of the frame in progress, None between frames
+        self._frame_start = None
+        self._label = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._target = threading.get_ident()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._sample_loop, name='spike-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+    def begin_frame(self, label=None):
+        if self._thread is None:
+            return
+        self._label = label
+        self._frame_start = perf_counter()
+        self._samples = []
+
+    def end_frame(self, phases=None):
+        """Close the frame, returns the trace path when it was over budget."""
+        if self._thread is None or self._samples is None:
+            return None
+        samples, self._samples = self._samples, None
+        frame_ms = (perf_counter() - self._frame_start) * 1000
+        if frame_ms <= self.budget_ms:
+            return None
+        return self.write(frame_ms, samples, phases)
+
+    def _sample_loop(self):
+        interval = self.sample_ms / 1000
+        while not self._stopped.is_set():
+            sleep(interval)
+            samples = self._samples
+            if samples is None:
+                continue
+            frame = sys._current_frames().get(self._target)
+            if frame is not None:
+                samples.append(self._stack(frame))
+
+    @staticmethod
+    def _stack(frame):
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+            frame = frame.f_back
+        stack.reverse()
+        return ';'.join(stack)
+
+    def write(self, frame_ms, samples, phases=None):
+        os.makedirs(self.directory, exist_ok=True)
+        now = datetime.now()
+        path = os.path.join(self.directory, f"{PREFIX}{now:%Y%m%d-%H%M%S-%f}.txt")
+
+        with open(path, 'w') as f:
+            f.write(f"frame {frame_ms:.1f} ms (budget {self.budget_ms} ms) at {now:%Y-%m-%d %H:%M:%S.%f}\n")
+            if self._label:
+                f.write(f"scene {self._label}\n")
+            if phases:
+                f.write("phases " + ', '.join(f"{name} {ms:.1f}" for name, ms in phases.items()) + "\n")
+            f.write(f"{len(samples)} samples every {self.sample_ms} ms\n\n")
+            for stack, count in Counter(samples).most_common():
+                f.write(f"{stack} {count}\n")
+
+        self.log.warning("Frame took %.1f ms, trace written to %s", frame_ms, path)
+        self._prune()
+        return path
+
+    def _prune(self):
+        if self.keep <= 0:
+            return
+        traces = sorted(name for name in os.listdir(self.directory) if name.startswith(PREFIX))
+        for name in traces[:-self.keep]:
+            os.remove(os.path.join(self.directory, name))
+
+
+# Started by the main loop when SPIKE_CAPTURE is on
+spike_watchdog = SpikeWatchdog()
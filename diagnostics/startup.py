@@ -0,0 +1,91 @@
+import builtins
+import importlib.util
+import sys
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+
+from config import STARTUP_BUDGET_MS
+
+TOP_IMPORTS = 25 # slowest imports listed in the report
+
+
+class StartupReport:
+    """
+    Wall time of every import and initialization step from enable() until the first frame.
+
+    Imports are timed by wrapping __import__ on the main thread: each module that was not loaded yet gets
+    its total time and its self time (without the imports it triggered), like python -X importtime.
+    Steps are named blocks, e.g. pygame.init or the UI theme parse. Nothing is recorded unless enabled.
+    """
+    def __init__(self, budget_ms=STARTUP_BUDGET_MS):
+        self.budget_ms = budget_ms
+        self.enabled = False
+        self.steps = []  # [(name, ms)]
+        self.imports = {}  # {module: (total ms, self ms)}
+        self._stack = []  # [[module, start, ms spent in nested imports]]
+        self._original_import = None
+        self._thread = None
+        self._start = 0.0
+
+    def enable(self):
+        self.enabled = True
+        self._start = perf_counter()
+        self._thread = threading.current_thread()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    @contextmanager
+    def step(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((name, (perf_counter() - start) * 1000))
+
+    def finish(self):
+        """Stop recording and print the breakdown, called once the first frame is on screen."""
+        if not self.enabled:
+            return
+        total_ms = (perf_counter() - self._start) * 1000
+        builtins.__import__ = self._original_import
+        self.enabled = False
+        print(self.format(total_ms))
+
+    def format(self, total_ms):
+        verdict = "over budget" if total_ms > self.budget_ms else "within budget"
+        lines = [f"Startup took {total_ms:.1f} ms to the first frame, {verdict} ({self.budget_ms} ms)", "Steps:"]
+        for name, ms in sorted(self.steps, key=lambda step: step[1], reverse=True):
+            lines.append(f"  {ms:8.1f} ms  {name}")
+
+        lines.append(f"Imports ({len(self.imports)} modules, slowest first, self / total):")
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)
+        for module, (total, own) in slowest[:TOP_IMPORTS]:
+            lines.append(f"  {own:8.1f} / {total:8.1f} ms  {module}")
+        return "\n".join(lines)
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        module = name
+        if level:
+            package = globals.get('__package__') if globals else None
+            module = importlib.util.resolve_name('.' * level + name, package) if package else name
+        if module in sys.modules or threading.current_thread() is not self._thread:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        frame = [module, perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            self._stack.pop()
+            total = (perf_counter() - frame[1]) * 1000
+            if self._stack:
+                self._stack[-1][2] += total
+            self.imports[module] = (total, total - frame[2])
+
+
+# Enabled by main.py --startup-report
+startup = StartupReport()
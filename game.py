@@ -1,4 +1,4 @@
-import inspect
+import sys
 
 import pygame
 import pygame_gui
@@ -8,37 +8,48 @@ from pokemon.definedenemies import EnemyEnum
 from pokemon.party import Party
 from pokemon.pokemon import Pokemon
 from pokemon.definedjobs import JobEnum
+from assets import loader, registry
 from audio.audio_manager import AudioManager
+from diagnostics import profiler, spike_watchdog, startup
+from scenes import GameOverScene, IntroScene, OverworldScene, SceneStack
 
 from sprites import *
+from world import Camera, ChunkStreamer, DirtyRectRenderer, MapFile, SpatialGrid, TileLayer
+from world.map_file import VOID_CHAR
 from config import *
 
 class Game:
     def __init__(self):
         self.log = logger.getChild(__name__)
 
-        pygame.init()
-        pygame.display.set_caption("Pokepy RPG")
+        with startup.step('pygame.init'):
+            pygame.init()
+            pygame.display.set_caption("Pokepy RPG")
 
-        self.audio = AudioManager()
+        with startup.step('audio init'):
+            self.audio = AudioManager()
+
+        with startup.step('display mode'):
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        with startup.step('asset preload'):
+            # Decoding starts as soon as there is a display format to convert to, the intro screen draws
+            # meanwhile and each scene only waits for its own images
+            for scene in (IntroScene, OverworldScene, GameOverScene):
+                for path in scene.assets:
+                    registry.preload(path)
 
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.clock = pygame.time.Clock() # frame rate
         self.running = True
-        self.paused = False
-        self.pause_menu = None
         self.quit = False
-        self.font = pygame.font.Font('C&CRedAlert.ttf', 72)
-
-        self.manager = pygame_gui.UIManager((SCREEN_WIDTH, SCREEN_HEIGHT), theme_path="ui_style.json")
+        self.scenes = SceneStack()
 
-        self.character_spritesheet = Spritesheet('img/character_spritesheet.png')
-        self.terrain_spritesheet = Spritesheet('img/terrain.png')
-        self.enemy_spritesheet = Spritesheet('img/enemy.png')
+        with startup.step('ui theme'):
+            self.manager = pygame_gui.UIManager((SCREEN_WIDTH, SCREEN_HEIGHT), theme_path="ui_style.json")
 
-        self.intro_background = pygame.image.load('img/introbackground.png')
-        self.gameover_background = pygame.image.load('img/gameover.png')
+        self.character_spritesheet = None
+        self.terrain_spritesheet = None
+        self.enemy_spritesheet = None
 
         #Generate jobs
         self.jobs = []
@@ -46,227 +57,217 @@ class Game:
         self.in_battle = False
         self.post_battle_cooldown = 0
 
-    def toggle_pause_menu(self):
-        if not self.paused:
-            self.log.debug("Pausing game")
-            self.audio.play_music('audio/music/Menu Screen.mp3')
-            self.paused = True
-
-            self.pause_menu = pygame_gui.elements.UIPanel(
-                relative_rect=pygame.Rect((0, 0), (SCREEN_WIDTH, SCREEN_HEIGHT)),
-                manager=self.manager,
-                object_id="#pause_menu"
-            )
-
-            menu_options = ["Items", "Equip", "Save", "Back"]
-            for idx, label in enumerate(menu_options):
-                pygame_gui.elements.UIButton(
-                    relative_rect=pygame.Rect((30, 30 + idx * 45), (150, 40)),
-                    text=label,
-                    manager=self.manager,
-                    container=self.pause_menu,
-                    object_id="#menu_button"
-                )
-
-            # Constants for layout
-            panel_width = 400
-            panel_height = 100
-            panel_padding = 5
-            start_x = 220
-            start_y = 5
-
-            # Loop through each member of the party
-            for index, member in enumerate(self.party.members):
-                offset_y = start_y + index * (panel_height + panel_padding)
-
-                # Create a panel for each party member
-                member_panel = pygame_gui.elements.UIPanel(
-                    relative_rect=pygame.Rect((start_x, offset_y), (panel_width, panel_height)),
-                    manager=self.manager,
-                    container=self.pause_menu,
-                    object_id=f"#member_panel_{index}"
-                )
-
-                # --- Sprite: UIImage on the left ---
-                sprite_y = (panel_height - member.height) // 2  # Center vertically
-
-                pygame_gui.elements.UIImage(
-                    relative_rect=pygame.Rect((50, sprite_y), (member.width, member.height)),
-                    image_surface=member.image,
-                    manager=self.manager,
-                    container=member_panel
-                )
-
-                # --- Stats: UILabel on the right ---
-                stats_text = (
-                    f"Name: {member.name}\n"
-                    f"Job: {member.job.name}\n"
-                    f"Level: {member.lvl}\n"
-                    f"HP: {member.current_health} / {member.health_capacity}\n"
-                )
-
-                text_box_x = member.width + 100  # adjust to give space beside sprite
-                text_box_width = panel_width
-
-                pygame_gui.elements.UITextBox(
-                    html_text=stats_text.replace("\n", "<br>"),
-                    relative_rect=pygame.Rect((text_box_x, 0), (text_box_width, panel_height)),
-                    manager=self.manager,
-                    container=member_panel,
-                    object_id="#stats_text"
-                )
-        else:
-            self.log.debug("Unpausing game")
-            self.audio.resume_previous_music()
-            self.paused = False
-            if self.pause_menu:
-                self.pause_menu.kill()
-                self.pause_menu = None
-
     def create_tilemap(self):
+        # Static terrain is baked once, only entities become drawable sprites
+        ground = self.terrain_spritesheet.get_sprite(*Ground.TILE_SOURCE, TILESIZE, TILESIZE, BLACK)
+        block = self.terrain_spritesheet.get_sprite(*Block.TILE_SOURCE, TILESIZE, TILESIZE, BLACK)
+        tiles = {'B': [ground, block], VOID_CHAR: []}
+
+        if MAP_FILE:
+            self.create_streamed_map(MapFile(MAP_FILE), tiles, ground, block)
+            return
+
+        self.streamer = None
+        self.tile_layer = TileLayer.from_tilemap(tilemap, tiles, [ground])
+
         for row_index, row in enumerate(tilemap):
             for col_index, column in enumerate(row):
-                Ground(self, col_index, row_index)
                 if column == 'B':
-                    Block(self, col_index, row_index)
+                    Block(self, col_index, row_index, block)
                 if column == 'E':
-                    # TODO: implement randomized enemy generation
-                    Enemy(self, 'Goblin', EnemyEnum.Goblin.value, col_index, row_index)
+                    self.spawn_enemy(col_index, row_index)
                 if column == 'P':
-                    Player(self, col_index, row_index)
+                    self.player = Player(self, col_index, row_index)
+
+    def create_streamed_map(self, map_file, tiles, ground, block):
+        # Only the chunks around the player exist as surfaces and sprites
+        self.tile_layer = TileLayer(map_file.cols, map_file.rows, tiles, [ground], map_file.chunk_tiles)
+        self.streamer = ChunkStreamer(
+            map_file, self.tile_layer,
+            lambda col, row: Block(self, col, row, block),
+            self.spawn_enemy
+        )
+
+        spawn = map_file.find_spawn('P')
+        if spawn is None:
+            raise ValueError(f"{map_file.path} has no player spawn ('P' tile)")
+        col, row = spawn
+        self.player = Player(self, col, row)
+        self.player.rect.topleft = (col * TILESIZE, row * TILESIZE)
+        self.streamer.update(self.player.rect.center)
+
+    def spawn_enemy(self, col, row):
+        # TODO: implement randomized enemy generation
+        if self.enemy_store is not None:
+            return self.enemy_store.spawn('Goblin', EnemyEnum.Goblin.value, col, row)
+        return PoolHandle(self.enemy_pool.acquire('Goblin', EnemyEnum.Goblin.value, col, row))
+
+    def load_world_assets(self):
+        # Kept for the whole session, only the first game waits for them (and only if still decoding)
+        if self.terrain_spritesheet is None:
+            # The battle scene is imported along with the world rather than at launch
+            from battle import Battle
+            for path in Battle.assets:
+                registry.preload(path)
+
+            self.character_spritesheet = Spritesheet('img/character_spritesheet.png')
+            self.terrain_spritesheet = Spritesheet('img/terrain.png')
+            self.enemy_spritesheet = Spritesheet('img/enemy.png')
 
     def new(self):
         # New game start
+        self.load_world_assets()
         self.playing = True
+        self.in_battle = False
+        self.post_battle_cooldown = 0
 
         self.all_sprites = pygame.sprite.LayeredUpdates()
         self.blocks = pygame.sprite.LayeredUpdates()
         self.enemies = pygame.sprite.LayeredUpdates()
         self.attacks = pygame.sprite.LayeredUpdates()
 
+        # Collision lookups only visit the cells around the player
+        self.block_grid = SpatialGrid()
+        self.enemy_grid = SpatialGrid()
+
+        # Killed enemies are reset and reused instead of cutting their frames again
+        self.enemy_pool = ObjectPool(lambda *args: Enemy(self, *args))
+        self.enemy_store = None
+        if ENTITY_STORE:
+            # Imported here so NumPy is only needed when the store is enabled
+            from world.entity_store import EnemyStore
+            self.enemy_store = EnemyStore(self)
+
+        self.camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.renderer = DirtyRectRenderer() if DIRTY_RECT_RENDERING else None
         self.create_tilemap()
+        self.camera.follow(self.player.rect)
+        self.camera.begin_tick()
+        self.tick_accumulator = 0
+        self.alpha = 1.0
 
         self.party = Party()
         self.party.add_pokemon(Pokemon('Bulbasaur', 28, 30, 35, 33, JobEnum.WARRIOR.value, None, None))
         self.party.add_pokemon(Pokemon('Charmander', 318, 29, 38, 42, JobEnum.THIEF.value, None, None))
 
-        self.manager = pygame_gui.UIManager((SCREEN_WIDTH, SCREEN_HEIGHT), theme_path="ui_style.json")
-
-    def events(self):
-        # game loop events(key presses, etc.)
-        for event in pygame.event.get():
-            # if game window is closed
-            if event.type == pygame.QUIT:
-                self.quit_game()
-
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.toggle_pause_menu()
-
-            if event.type == pygame_gui.UI_BUTTON_PRESSED:
-                if self.paused and event.ui_element.text == "Resume":
-                    self.toggle_pause_menu()
-
-            self.manager.process_events(event)
-
-    def update(self):
-        # game loop updates
-        time_delta = self.clock.tick(FPS) / 1000.0
-        self.manager.update(time_delta)
+        # Same theme as the intro's manager, clearing it is much cheaper than parsing the theme again
+        self.manager.clear_and_reset()
 
-        if not self.paused:
-            self.all_sprites.update()
-            self.audio.update_music()
-            if self.post_battle_cooldown > 0:
-                self.post_battle_cooldown -= self.clock.get_time()
+    def update(self, frame_ms):
+        # The world advances in fixed TICK_MS steps however long the frame took
+        self.tick_accumulator += frame_ms
+        ticks = 0
+        while self.playing and not self.in_battle and self.tick_accumulator >= TICK_MS:
+            if ticks == MAX_TICKS_PER_FRAME:
+                # Too far behind (slow frame, window drag...), drop the backlog rather than spiral
+                self.tick_accumulator %= TICK_MS
+                break
+            self.tick()
+            self.tick_accumulator -= TICK_MS
+            ticks += 1
+
+        # How far into the next tick this frame is drawn
+        self.alpha = self.tick_accumulator / TICK_MS
+
+    def tick(self):
+        # One fixed simulation step
+        self.camera.begin_tick()
+        if self.enemy_store is not None:
+            # Enemies move before the player checks for collisions, as with sprite updates
+            self.enemy_store.update()
+            self.enemy_store.sync(self.camera.view_rect.inflate(2 * TILESIZE, 2 * TILESIZE))
+        self.all_sprites.update()
+        if self.streamer:
+            self.streamer.update(self.player.rect.center)
+        if self.post_battle_cooldown > 0:
+            self.post_battle_cooldown -= TICK_MS
+
+    def draw(self, full=False):
+        # Overworld draw, positions are interpolated between the last two ticks
+        self.camera.interpolate(self.alpha)
+        if self.renderer and not full:
+            dirty = self.renderer.draw(self.screen, self.camera, self.tile_layer, self.all_sprites, self.alpha)
+            self.manager.draw_ui(self.screen)
+            with profiler.phase('flip'):
+                if dirty is None:
+                    pygame.display.update()
+                elif dirty:
+                    pygame.display.update(dirty)
+            return
 
-    def draw(self):
-        # game loop draw
         self.screen.fill(BLACK) # clear screen
-        self.all_sprites.draw(self.screen)
+        self.tile_layer.draw(self.screen, self.camera)
+        self.camera.draw(self.screen, self.all_sprites, self.alpha)
         self.manager.draw_ui(self.screen)
-        pygame.display.update()
-
-    def main(self):
-        # game loop
-        while self.playing:
-            self.events()
-            self.update()
-            self.draw()
-
-    def quit_game(self):
-        self.log.info("Quitting from " + str(inspect.stack()[1].function))
-        self.running = False
-        self.playing = False
-        self.quit = True
-
-    def game_over(self):
-        self.manager.clear_and_reset()
-
-        text = self.font.render('Game Over', False, WHITE)
-        text_rect = text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/4))
-
-        restart_button_rect = pygame.Rect(0, 0, 200, 50)
-        restart_button_rect.center = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 50)
-        restart_button = pygame_gui.elements.UIButton(
-            relative_rect=restart_button_rect,
-            text='Restart',
-            manager=self.manager
-        )
-
-        self.waiting = True
-        while self.waiting and self.running:
-            time_delta = self.clock.tick(FPS) / 1000.0
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.quit_game()
-
-                if event.type == pygame_gui.UI_BUTTON_PRESSED:
-                    if event.ui_element == restart_button:
-                        self.waiting = False
-                        self.running = False
-
-                self.manager.process_events(event)
-
-            self.manager.update(time_delta)
-            self.screen.blit(self.gameover_background, (0, 0))
-            self.screen.blit(text, text_rect)
-            self.manager.draw_ui(self.screen)
+        with profiler.phase('flip'):
             pygame.display.update()
 
-    def intro_screen(self):
-        self.audio.play_music('audio/music/Prelude.mp3')
+    def start_battle(self, enemy):
+        from battle import Battle
 
-        intro = True
-        self.manager.clear_and_reset()
-
-        title = self.font.render('Pokepy RPG', False, BLACK)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/4))
-
-        play_button_rect = pygame.Rect(0, 0, 200 ,50)
-        play_button_rect.center = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 50)
-        play_button = pygame_gui.elements.UIButton(relative_rect=play_button_rect,
-                                                    text='Play',
-                                                    manager=self.manager)
-
-        while intro:
-            time_delta = self.clock.tick(FPS)/1000.0
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    intro = False
-                    self.quit_game()
-
-                if event.type == pygame_gui.UI_BUTTON_PRESSED:
-                    if event.ui_element == play_button:
-                        intro = False
+        self.in_battle = True
+        self.scenes.push(Battle(self, enemy, self.party))
 
-                self.manager.process_events(event)
+    def end_battle(self, enemy, result):
+        """Called by the battle once it has left the scene stack."""
+        self.log.debug("Battle result %s", result)
+        self.in_battle = False
 
-            self.manager.update(time_delta)
+        if result == "victory":
+            # Survived — back on the map without the enemy
+            enemy.kill()
+        elif result == "escape":
+            self.post_battle_cooldown = 2000
+        elif result == "defeat":
+            # Player was defeated — trigger game over
+            self.playing = False
+            self.scenes.replace(GameOverScene(self))
+
+    def run(self):
+        # The game loop: every screen is a scene and only the one on top of the stack runs
+        self.scenes.push(IntroScene(self))
+        if SPIKE_CAPTURE:
+            spike_watchdog.start()
+
+        while self.running and self.scenes.top:
+            frame_ms = self.clock.tick(FPS)
+            profiler.begin_frame()
+            spike_watchdog.begin_frame(type(self.scenes.top).__name__)
+
+            with profiler.phase('events'):
+                for event in pygame.event.get():
+                    # if game window is closed
+                    if event.type == pygame.QUIT:
+                        self.quit_game()
+                        break
+                    if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        profiler.toggle_overlay()
+                        self.scenes.top.invalidate()
+                        continue
+                    self.scenes.top.handle_event(event)
+
+            if not self.running:
+                break
+            with profiler.phase('update'):
+                self.scenes.top.update(frame_ms)
+            with profiler.phase('draw'):
+                self.scenes.top.draw()
+            with profiler.phase('audio'):
+                self.audio.update_music()
+
+            if profiler.show_overlay:
+                pygame.display.update(profiler.draw_overlay(self.screen))
+            spike_watchdog.end_frame(profiler.end_frame())
+            startup.finish()
+
+        spike_watchdog.stop()
+        self.scenes.clear()
+        self.audio.close()
+        loader.close()
+        profiler.export()
 
-            self.screen.blit(self.intro_background, (0, 0))
-            self.screen.blit(title, title_rect)
-            self.manager.draw_ui(self.screen)
-            pygame.display.update()
\ No newline at end of file
+    def quit_game(self):
+        self.log.info("Quitting from %s", sys._getframe(1).f_code.co_name)
+        self.running = False
+        self.playing = False
+        self.quit = True
\ No newline at end of file
@@ -1,28 +1,127 @@
+import atexit
 import logging
+import logging.handlers
+import queue
+from collections import deque
+
 import config
 import os
 
-# Make sure logs directory exists
-os.makedirs("logs", exist_ok=True)
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hands records to the listener thread without formatting them.
+
+    The stock QueueHandler formats every message on the calling thread, here msg % args is left to
+    the thread that writes it. Log arguments should therefore be values that are not changed later
+    (names, numbers), not live objects. Tracebacks are rendered here as they cannot wait.
+    """
+    def prepare(self, record):
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Keeps the last capacity records in memory and only writes them to the target handlers when a
+    record at flush_level or above arrives, or when logging shuts down.
+    """
+    def __init__(self, targets, capacity, flush_level=logging.ERROR):
+        logging.Handler.__init__(self)
+        self.targets = targets
+        self.flush_level = flush_level
+        self.buffer = deque(maxlen=capacity)
+
+    def emit(self, record):
+        self.buffer.append(record)
+        if record.levelno >= self.flush_level:
+            self.flush()
+
+    def flush(self):
+        self.acquire()
+        try:
+            while self.buffer:
+                record = self.buffer.popleft()
+                for target in self.targets:
+                    if record.levelno >= target.level:
+                        target.handle(record)
+            for target in self.targets:
+                target.flush()
+        finally:
+            self.release()
+
+    def close(self):
+        self.flush()
+        logging.Handler.close(self)
+
 
 # Get the root logger (or a project-wide logger)
 logger = logging.getLogger("pokepy")
 logger.setLevel(config.LOG_LEVEL)
-logger.handlers.clear()  # prevent duplicate handlers
 
-# File handler (overwrite each run)
-file_handler = logging.FileHandler(config.LOG_FILE, mode="w")
-file_handler.setLevel(config.LOG_LEVEL)
+# Per-subsystem levels, children are named after their module (pokepy.battle, pokepy.world.chunk_streamer...)
+for name, level in config.LOG_LEVELS.items():
+    logger.getChild(name).setLevel(level)
+
+# Filled by setup_logging(), until then records only reach Python's last resort handler (warnings and up)
+handlers = []
+listener = None
+_running = False
+
+
+def setup_logging():
+    """Attach the file and console handlers, behind the background listener with LOG_ASYNC. Called by main.py."""
+    global listener, _running
+    if _running:
+        return
+
+    # Make sure logs directory exists
+    os.makedirs(os.path.dirname(config.LOG_FILE) or '.', exist_ok=True)
+    logger.handlers.clear()  # prevent duplicate handlers
+
+    # File handler (overwrite each run)
+    file_handler = logging.FileHandler(config.LOG_FILE, mode="w")
+    file_handler.setLevel(config.LOG_LEVEL)
+
+    # Console handler
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(config.LOG_LEVEL)
+
+    # Formatter
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    file_handler.setFormatter(formatter)
+    console_handler.setFormatter(formatter)
+
+    if config.LOG_RING_BUFFER:
+        # Both outputs go quiet until an error, which then shows the same history on the console and in the file
+        handlers[:] = [RingBufferHandler([console_handler, file_handler], config.LOG_RING_BUFFER)]
+    else:
+        handlers[:] = [console_handler, file_handler]
+
+    if config.LOG_ASYNC:
+        # The game thread only queues records, formatting and I/O happen on the listener's thread
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(LazyQueueHandler(log_queue))
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+    else:
+        # Attach handlers
+        for handler in handlers:
+            logger.addHandler(handler)
 
-# Console handler
-console_handler = logging.StreamHandler()
-console_handler.setLevel(config.LOG_LEVEL)
+    _running = True
+    atexit.register(shutdown_logging)
 
-# Formatter
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-file_handler.setFormatter(formatter)
-console_handler.setFormatter(formatter)
 
-# Attach handlers
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+def shutdown_logging():
+    """Write out everything still queued or buffered, runs at exit."""
+    global _running
+    if not _running:
+        return
+    _running = False
+    if listener is not None:
+        listener.stop()
+    for handler in handlers:
+        handler.flush()
@@ -1,32 +1,34 @@
+import argparse
 import sys
-import pygame
 
-from game import Game
-from config import *
+from diagnostics import startup
 
-def run_game():
-    pygame.init()
-    pygame.display.set_caption("Pokepy RPG")
 
-    running = True
-    while running:
-        g = Game()
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Pokepy RPG")
+    parser.add_argument('--startup-report', action='store_true',
+                        help="print the time spent in each import and initialization step up to the first frame")
+    return parser.parse_args(argv)
 
-        g.intro_screen()
 
-        g.audio.play_music('audio/music/Main Theme.mp3', fadeout_ms=FADEOUT_MS)
+def run_game(startup_report=False):
+    if startup_report:
+        startup.enable()
 
-        g.new()
+    with startup.step('setup logging'):
+        from logger_config import setup_logging
+        setup_logging()
 
-        while g.running:
-            g.main()
-            g.game_over()
+    # Imported here so --startup-report also times the game's own imports
+    with startup.step('import game'):
+        import pygame
+        from game import Game
 
-        if g.quit:
-            running = g.running
+    g = Game()
+    g.run()
 
     pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
-    run_game()
+    run_game(parse_args().startup_report)
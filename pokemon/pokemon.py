@@ -1,34 +1,71 @@
+from combat.engine import party_member_attacks, party_member_crit
 from config import *
 from sprites import *
 
 class Pokemon:
+    # Only per-member state lives on the instance, base stats and portraits come from the job's archetype
+    __slots__ = ('archetype', 'name', 'weapon', 'armor', 'exp', 'lvl', 'crit', 'current_health', 'initiative',
+                 'width', 'height', 'image')
+
     def __init__(self, name, x, y, width, height, job, weapon, armor):
+        self.archetype = archetype(job)  # Shared per Job instance
         self.name = name
-        self.job = job            # Instance of Job
         self.weapon = weapon      # Instance of Weapon
         self.armor = armor        # Instance of Armor
 
-        self.base_stats = job.get_base_stats()  # Dict of base stats
-        self.stats = self.base_stats
-        self.agl = self.stats['AGL']
-        self.acc = self.stats['ACC']
-        self.eva = self.stats['EVA']
-        self.lck = self.stats['LCK']
-        self.str = self.stats['STR']
         self.exp = 0
         self.lvl = 1
-        self.crit = 0 if self.job.name != 'Monk' else self.lvl * 2 # determined by weapon
-        self.current_health = self.stats['HP']
-        self.health_capacity = self.stats['HP']
+        self.crit = party_member_crit(self.job.name, self.lvl) # determined by weapon
+        self.current_health = self.health_capacity
 
         self.width = width
         self.height = height
-        self.enemy_spritesheet = Spritesheet('img/pokemon_spritesheet.png')
-        self.image = self.enemy_spritesheet.get_sprite(x, y, self.width, self.height, BLACK)
+        self.image = self.archetype.frame(('portrait', x, y, width, height),
+                                          lambda: self.cut_portrait(x, y, width, height))
 
-    def get_number_of_attacks(self):
-        num_attacks = max(self.acc // 32, 1)
-        if self.job.name == 'Monk':
-            num_attacks *= 2
-        return num_attacks
+    @staticmethod
+    def cut_portrait(x, y, width, height):
+        # The sheet is shared through the asset registry, only the cut sprite is kept
+        spritesheet = Spritesheet('img/pokemon_spritesheet.png')
+        image = spritesheet.get_sprite(x, y, width, height, BLACK)
+        spritesheet.release()
+        return image
+
+    @property
+    def job(self):
+        return self.archetype.job
+
+    @property
+    def base_stats(self):
+        return self.archetype.base_stats
+
+    @property
+    def stats(self):
+        return self.archetype.base_stats
+
+    @property
+    def agl(self):
+        return self.stats['AGL']
 
+    @property
+    def acc(self):
+        return self.stats['ACC']
+
+    @property
+    def eva(self):
+        return self.stats['EVA']
+
+    @property
+    def lck(self):
+        return self.stats['LCK']
+
+    @property
+    def str(self):
+        return self.stats['STR']
+
+    @property
+    def health_capacity(self):
+        return self.stats['HP']
+
+    def get_number_of_attacks(self):
+        return party_member_attacks(self.acc, self.job.name)
\ No newline at end of file
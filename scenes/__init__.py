@@ -0,0 +1,5 @@
+from .scene import Scene, SceneStack
+from .intro import IntroScene
+from .overworld import OverworldScene
+from .pause import PauseScene
+from .game_over import GameOverScene
\ No newline at end of file
@@ -0,0 +1,50 @@
+import pygame
+import pygame_gui
+
+from assets import registry, text_cache
+from config import *
+from diagnostics import profiler
+from .intro import IntroScene
+from .scene import Scene
+
+
+class GameOverScene(Scene):
+    """Shown after a lost battle, Restart goes back to the title screen."""
+    assets = ('img/gameover.png',)
+
+    def enter(self):
+        self.background = registry.acquire('img/gameover.png')
+        self.manager = self.game.manager
+        self.manager.clear_and_reset()
+
+        self.text = text_cache.render('Game Over', 72, WHITE, 'C&CRedAlert.ttf', antialias=False)
+        self.text_rect = self.text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/4))
+
+        restart_button_rect = pygame.Rect(0, 0, 200, 50)
+        restart_button_rect.center = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 50)
+        self.restart_button = pygame_gui.elements.UIButton(
+            relative_rect=restart_button_rect,
+            text='Restart',
+            manager=self.manager
+        )
+
+    def exit(self):
+        registry.release('img/gameover.png')
+
+    def handle_event(self, event):
+        if event.type == pygame_gui.UI_BUTTON_PRESSED and event.ui_element == self.restart_button:
+            self.game.scenes.replace(IntroScene(self.game))
+            return
+
+        self.manager.process_events(event)
+
+    def update(self, frame_ms):
+        self.manager.update(frame_ms / 1000.0)
+
+    def draw(self):
+        screen = self.game.screen
+        screen.blit(self.background, (0, 0))
+        screen.blit(self.text, self.text_rect)
+        self.manager.draw_ui(screen)
+        with profiler.phase('flip'):
+            pygame.display.update()
@@ -0,0 +1,62 @@
+import pygame
+import pygame_gui
+
+from assets import loader, registry, text_cache
+from config import *
+from diagnostics import profiler
+from .scene import Scene
+
+
+class IntroScene(Scene):
+    """Title screen, Play starts a new game on the overworld. Shows a bar while assets load."""
+    assets = ('img/introbackground.png',)
+
+    def enter(self):
+        self.game.audio.play_music('audio/music/Prelude.mp3')
+        self.background = registry.acquire('img/introbackground.png')
+
+        self.manager = self.game.manager
+        self.manager.clear_and_reset()
+
+        self.title = text_cache.render('Pokepy RPG', 72, BLACK, 'C&CRedAlert.ttf', antialias=False)
+        self.title_rect = self.title.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT/4))
+
+        play_button_rect = pygame.Rect(0, 0, 200 ,50)
+        play_button_rect.center = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 50)
+        self.play_button = pygame_gui.elements.UIButton(relative_rect=play_button_rect,
+                                                        text='Play',
+                                                        manager=self.manager)
+        self.progress_rect = pygame.Rect(0, 0, 200, 6)
+        self.progress_rect.midtop = (play_button_rect.centerx, play_button_rect.bottom + 20)
+
+    def exit(self):
+        registry.release('img/introbackground.png')
+
+    def handle_event(self, event):
+        if event.type == pygame_gui.UI_BUTTON_PRESSED and event.ui_element == self.play_button:
+            from .overworld import OverworldScene
+
+            self.game.audio.play_music('audio/music/Main Theme.mp3', fadeout_ms=FADEOUT_MS)
+            self.game.new()
+            self.game.scenes.replace(OverworldScene(self.game))
+            return
+
+        self.manager.process_events(event)
+
+    def update(self, frame_ms):
+        self.manager.update(frame_ms / 1000.0)
+
+    def draw(self):
+        screen = self.game.screen
+        screen.blit(self.background, (0, 0))
+        screen.blit(self.title, self.title_rect)
+        self.manager.draw_ui(screen)
+        if not loader.done:
+            # Play works right away, the overworld only waits for the images it needs
+            filled = self.progress_rect.copy()
+            filled.width = round(filled.width * loader.progress)
+            pygame.draw.rect(screen, WHITE, self.progress_rect)
+            pygame.draw.rect(screen, BLACK, filled)
+            pygame.draw.rect(screen, BLACK, self.progress_rect, 1)
+        with profiler.phase('flip'):
+            pygame.display.update()
@@ -0,0 +1,40 @@
+import pygame
+
+from diagnostics import profiler
+from .pause import PauseScene
+from .scene import Scene
+
+
+class OverworldScene(Scene):
+    """The map: fixed-timestep world updates, Escape opens the pause menu."""
+    # Acquired by Game.new() before the scene is pushed
+    assets = ('img/character_spritesheet.png', 'img/terrain.png', 'img/enemy.png', 'img/pokemon_spritesheet.png')
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.game.scenes.push(PauseScene(self.game))
+            return
+
+        self.game.manager.process_events(event)
+
+    def update(self, frame_ms):
+        with profiler.phase('overworld.ui'):
+            self.game.manager.update(frame_ms / 1000.0)
+        with profiler.phase('overworld.ticks'):
+            self.game.update(frame_ms)
+
+    def draw(self):
+        self.game.draw()
+
+    def resume(self):
+        # Another screen drew over the map
+        self.invalidate()
+
+    def invalidate(self):
+        if self.game.renderer:
+            self.game.renderer.invalidate()
+
+    def exit(self):
+        if self.game.streamer:
+            self.game.streamer.close()
+            self.game.streamer = None
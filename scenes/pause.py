@@ -0,0 +1,99 @@
+import pygame
+import pygame_gui
+
+from config import *
+from .scene import Scene
+
+
+class PauseScene(Scene):
+    """Menu over the map with the party's stats, Escape goes back to the overworld."""
+    def enter(self):
+        self.log.debug("Pausing game")
+        self.game.audio.play_music('audio/music/Menu Screen.mp3')
+
+        self.pause_menu = pygame_gui.elements.UIPanel(
+            relative_rect=pygame.Rect((0, 0), (SCREEN_WIDTH, SCREEN_HEIGHT)),
+            manager=self.game.manager,
+            object_id="#pause_menu"
+        )
+
+        menu_options = ["Items", "Equip", "Save", "Back"]
+        for idx, label in enumerate(menu_options):
+            pygame_gui.elements.UIButton(
+                relative_rect=pygame.Rect((30, 30 + idx * 45), (150, 40)),
+                text=label,
+                manager=self.game.manager,
+                container=self.pause_menu,
+                object_id="#menu_button"
+            )
+
+        # Constants for layout
+        panel_width = 400
+        panel_height = 100
+        panel_padding = 5
+        start_x = 220
+        start_y = 5
+
+        # Loop through each member of the party
+        for index, member in enumerate(self.game.party.members):
+            offset_y = start_y + index * (panel_height + panel_padding)
+
+            # Create a panel for each party member
+            member_panel = pygame_gui.elements.UIPanel(
+                relative_rect=pygame.Rect((start_x, offset_y), (panel_width, panel_height)),
+                manager=self.game.manager,
+                container=self.pause_menu,
+                object_id=f"#member_panel_{index}"
+            )
+
+            # --- Sprite: UIImage on the left ---
+            sprite_y = (panel_height - member.height) // 2  # Center vertically
+
+            pygame_gui.elements.UIImage(
+                relative_rect=pygame.Rect((50, sprite_y), (member.width, member.height)),
+                image_surface=member.image,
+                manager=self.game.manager,
+                container=member_panel
+            )
+
+            # --- Stats: UILabel on the right ---
+            stats_text = (
+                f"Name: {member.name}\n"
+                f"Job: {member.job.name}\n"
+                f"Level: {member.lvl}\n"
+                f"HP: {member.current_health} / {member.health_capacity}\n"
+            )
+
+            text_box_x = member.width + 100  # adjust to give space beside sprite
+            text_box_width = panel_width
+
+            pygame_gui.elements.UITextBox(
+                html_text=stats_text.replace("\n", "<br>"),
+                relative_rect=pygame.Rect((text_box_x, 0), (text_box_width, panel_height)),
+                manager=self.game.manager,
+                container=member_panel,
+                object_id="#stats_text"
+            )
+
+    def exit(self):
+        self.log.debug("Unpausing game")
+        self.game.audio.resume_previous_music()
+        self.pause_menu.kill()
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.game.scenes.pop()
+            return
+
+        if event.type == pygame_gui.UI_BUTTON_PRESSED and event.ui_element.text == "Resume":
+            self.game.scenes.pop()
+            return
+
+        self.game.manager.process_events(event)
+
+    def update(self, frame_ms):
+        self.game.manager.update(frame_ms / 1000.0)
+
+    def draw(self):
+        # The panel covers the whole map, so skip the dirty-rect renderer
+        self.game.draw(full=True)
\ No newline at end of file
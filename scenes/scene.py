@@ -0,0 +1,81 @@
+from logger_config import logger
+
+
+class Scene:
+    """
+    One screen of the game (intro, overworld, pause menu, battle, game over).
+
+    Only the scene on top of Game.scenes gets events, updates and draws each frame, the ones below it
+    are suspended until it is popped.
+    """
+    # Images the scene acquires, Game starts decoding them in the background at startup
+    assets = ()
+
+    def __init__(self, game):
+        self.log = logger.getChild(type(self).__module__)
+        self.game = game
+
+    def enter(self):
+        """Pushed onto the stack."""
+
+    def exit(self):
+        """Popped or replaced."""
+
+    def pause(self):
+        """Another scene was pushed on top."""
+
+    def resume(self):
+        """The scene on top was popped."""
+
+    def invalidate(self):
+        """Something else drew on the screen, repaint all of it on the next draw."""
+
+    def handle_event(self, event):
+        pass
+
+    def update(self, frame_ms):
+        pass
+
+    def draw(self):
+        pass
+
+
+class SceneStack:
+    """Scenes with push/pop transitions, the top one is the active scene."""
+    def __init__(self):
+        self.log = logger.getChild(__name__)
+        self._scenes = []
+
+    def __len__(self):
+        return len(self._scenes)
+
+    @property
+    def top(self):
+        return self._scenes[-1] if self._scenes else None
+
+    def push(self, scene):
+        if self._scenes:
+            self._scenes[-1].pause()
+        self.log.debug("Push %s", type(scene).__name__)
+        self._scenes.append(scene)
+        scene.enter()
+
+    def pop(self):
+        scene = self._scenes.pop()
+        self.log.debug("Pop %s", type(scene).__name__)
+        scene.exit()
+        if self._scenes:
+            self._scenes[-1].resume()
+        return scene
+
+    def replace(self, scene):
+        """Swap the top scene for another one, the scene below is not resumed in between."""
+        old = self._scenes.pop()
+        self.log.debug("Replace %s with %s", type(old).__name__, type(scene).__name__)
+        old.exit()
+        self._scenes.append(scene)
+        scene.enter()
+
+    def clear(self):
+        while self._scenes:
+            self._scenes.pop().exit()
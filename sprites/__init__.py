@@ -2,4 +2,6 @@ from .player import Player
 from .enemy import Enemy
 from .block import Block
 from .ground import Ground
-from .spritesheet import Spritesheet
\ No newline at end of file
+from .spritesheet import Spritesheet
+from .archetype import Archetype, archetype
+from .pool import ObjectPool, PoolHandle
\ No newline at end of file
@@ -0,0 +1,33 @@
+from types import MappingProxyType
+
+
+class Archetype:
+    """
+    Data shared by every enemy or party member of one job: read-only base stats and cut frames.
+
+    Instances keep a reference to their archetype and only store their own mutable state.
+    """
+    __slots__ = ('job', 'base_stats', 'frames')
+
+    def __init__(self, job):
+        self.job = job
+        self.base_stats = MappingProxyType(job.get_base_stats())
+        self.frames = {}  # {key: surface or tuple of surfaces}
+
+    def frame(self, key, build):
+        """Frames stored under key, build() cuts them the first time they are asked for."""
+        frames = self.frames.get(key)
+        if frames is None:
+            frames = self.frames[key] = build()
+        return frames
+
+
+# One archetype per Job (i.e. per EnemyEnum/JobEnum entry)
+_archetypes = {}
+
+
+def archetype(job):
+    shared = _archetypes.get(job)
+    if shared is None:
+        shared = _archetypes[job] = Archetype(job)
+    return shared
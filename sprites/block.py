@@ -2,10 +2,13 @@ import pygame
 from config import *
 
 class Block(pygame.sprite.Sprite):
-    def __init__(self, game, x, y):
+    TILE_SOURCE = (960, 448) # position on the terrain spritesheet
+
+    def __init__(self, game, x, y, image=None):
+        # Blocks are drawn by the baked tile layer and only kept for collisions
         self.game = game
         self._layer = BLOCK_LAYER
-        self.groups = self.game.all_sprites, self.game.blocks
+        self.groups = self.game.blocks
         pygame.sprite.Sprite.__init__(self, self.groups)
 
         self.x = x *  TILESIZE
@@ -13,8 +16,16 @@ class Block(pygame.sprite.Sprite):
         self.width =  TILESIZE
         self.height = TILESIZE
 
-        self.image = self.game.terrain_spritesheet.get_sprite(960, 448, self.width, self.height, BLACK)
+        if image is None:
+            image = self.game.terrain_spritesheet.get_sprite(*self.TILE_SOURCE, self.width, self.height, BLACK)
+        self.image = image
 
         self.rect = self.image.get_rect()
         self.rect.x = self.x
-        self.rect.y = self.y
\ No newline at end of file
+        self.rect.y = self.y
+
+        self.game.block_grid.insert(self)
+
+    def kill(self):
+        self.game.block_grid.remove(self)
+        pygame.sprite.Sprite.kill(self)
\ No newline at end of file
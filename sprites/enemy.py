@@ -2,64 +2,138 @@ import math
 import pygame
 import random
 from config import *
+from .archetype import archetype
 
 class Enemy(pygame.sprite.Sprite):
+    # Only per-enemy state lives on the instance, stats and frames come from the job's archetype
+    _layer = ENEMY_LAYER
+    width = TILESIZE
+    height = TILESIZE
+    crit = 0
+
     def __init__(self, game, name, job, x, y):
-        self.job = job            # Instance of Job
-        self.base_stats = job.get_base_stats()  # Dict of base stats
-        self.stats = self.base_stats
-
-        self.agl = self.stats['AGL']
-        self.acc = self.stats['ACC']
-        self.eva = self.stats['EVA']
-        self.lck = self.stats['LCK']
-        self.exp = self.stats['EXP']
-        self.str = self.stats['STR']
-        self.crit = 0
-        self.current_health = self.stats['HP']
-        self.health_capacity = self.stats['HP']
         self.game = game
+        pygame.sprite.Sprite.__init__(self)
+        self.generation = 0
+        self.reset(name, job, x, y)
+
+    def reset(self, name, job, x, y):
+        """Put the enemy on the map at a tile position, also used when it is taken back out of the pool."""
+        self.archetype = archetype(job)  # Shared per Job instance
+        self.frames = self.archetype.frame('overworld', lambda: self.cut_frames(self.game.enemy_spritesheet))
         self.name = name
-        self._layer = ENEMY_LAYER
-        self.groups = self.game.all_sprites, self.game.enemies
-        pygame.sprite.Sprite.__init__(self, self.groups)
+        self.current_health = self.health_capacity
 
         self.x = x *  TILESIZE
         self.y = y *  TILESIZE
-        self.width =  TILESIZE
-        self.height = TILESIZE
 
         self.x_change = 0
         self.y_change = 0
+        self.previous_pos = None  # rect position before the last tick, for interpolated drawing
 
         self.facing = random.choice(['left', 'right'])
         self.animation_loop = 1
         self.movement_loop = 0
         self.max_travel = random.randint(7, 30)
 
-        self.image = self.game.enemy_spritesheet.get_sprite(3, 2, self.width, self.height, BLACK)
+        # Set by world.entity_store.EnemyStore when it drives this sprite
+        self.store = None
+        self.store_index = None
+        # Bumped on every reuse so handles to a previous life see it as dead
+        self.generation += 1
 
+        self.image = self.frames[0]
         self.rect = self.image.get_rect()
         self.rect.x = self.x
         self.rect.y = self.y
+        self.add(self.game.all_sprites, self.game.enemies)
+        self.game.enemy_grid.insert(self)
+
+    @classmethod
+    def cut_frames(cls, spritesheet):
+        """(standing, left walk cycle, right walk cycle)"""
+        standing = spritesheet.get_sprite(3, 2, cls.width, cls.height, BLACK)
+        left = tuple(spritesheet.get_sprite(x, 98, cls.width, cls.height, BLACK) for x in (3, 35, 68))
+        right = tuple(spritesheet.get_sprite(x, 66, cls.width, cls.height, BLACK) for x in (3, 35, 68))
+        return standing, left, right
+
+    @property
+    def job(self):
+        return self.archetype.job
+
+    @property
+    def base_stats(self):
+        return self.archetype.base_stats
+
+    @property
+    def stats(self):
+        return self.archetype.base_stats
+
+    @property
+    def agl(self):
+        return self.stats['AGL']
+
+    @property
+    def acc(self):
+        return self.stats['ACC']
 
-        self.left_animations = [self.game.enemy_spritesheet.get_sprite(3, 98, self.width, self.height, BLACK),
-                           self.game.enemy_spritesheet.get_sprite(35, 98, self.width, self.height, BLACK),
-                           self.game.enemy_spritesheet.get_sprite(68, 98, self.width, self.height, BLACK)]
+    @property
+    def eva(self):
+        return self.stats['EVA']
 
-        self.right_animations = [self.game.enemy_spritesheet.get_sprite(3, 66, self.width, self.height, BLACK),
-                            self.game.enemy_spritesheet.get_sprite(35, 66, self.width, self.height, BLACK),
-                            self.game.enemy_spritesheet.get_sprite(68, 66, self.width, self.height, BLACK)]
+    @property
+    def lck(self):
+        return self.stats['LCK']
+
+    @property
+    def exp(self):
+        return self.stats['EXP']
+
+    @property
+    def str(self):
+        return self.stats['STR']
+
+    @property
+    def health_capacity(self):
+        return self.stats['HP']
+
+    @property
+    def left_animations(self):
+        return self.frames[1]
+
+    @property
+    def right_animations(self):
+        return self.frames[2]
 
     def get_number_of_attacks(self):
         return 1
 
+    def kill(self):
+        if self.store is not None:
+            self.store.remove(self.store_index)
+        else:
+            self.release()
+
+    def release(self):
+        """Take the sprite off the map without touching the enemy store row and return it to the pool."""
+        self.store = None
+        self.store_index = None
+        self.game.enemy_grid.remove(self)
+        pygame.sprite.Sprite.kill(self)
+        self.game.enemy_pool.release(self)
+
     def update(self):
+        if self.store is not None:
+            return
+
+        self.previous_pos = self.rect.topleft
         self.movement()
         self.animate()
 
         self.rect.x += self.x_change
         self.rect.y += self.y_change
+        if self.x_change or self.y_change:
+            self.game.enemy_grid.move(self)
 
         self.x_change = 0
         self.y_change = 0
@@ -2,6 +2,8 @@ import pygame
 from config import *
 
 class Ground(pygame.sprite.Sprite):
+    TILE_SOURCE = (64, 352) # position on the terrain spritesheet
+
     def __init__(self, game, x, y):
         self.game = game
         self._layer = GROUND_LAYER
@@ -13,7 +15,7 @@ class Ground(pygame.sprite.Sprite):
         self.width =  TILESIZE
         self.height = TILESIZE
 
-        self.image = self.game.terrain_spritesheet.get_sprite(64, 352, self.width, self.height, BLACK)
+        self.image = self.game.terrain_spritesheet.get_sprite(*self.TILE_SOURCE, self.width, self.height, BLACK)
 
         self.rect = self.image.get_rect()
         self.rect.x = self.x
@@ -1,7 +1,6 @@
 import math
 import pygame
 
-from battle import Battle
 from config import *
 from logger_config import logger
 
@@ -23,6 +22,7 @@ class Player(pygame.sprite.Sprite):
 
         self.x_change = 0
         self.y_change = 0
+        self.previous_pos = None  # rect position before the last tick, for interpolated drawing
 
         self.facing = 'down'
         self.animation_loop = 1
@@ -53,6 +53,7 @@ class Player(pygame.sprite.Sprite):
     def update(self):
         old_x = self.rect.x
         old_y = self.rect.y
+        self.previous_pos = (old_x, old_y)
 
         self.movement()
         self.animate()
@@ -71,9 +72,7 @@ class Player(pygame.sprite.Sprite):
 
         # Move camera only if there was actual movement
         if moved_x != 0 or moved_y != 0:
-            for sprite in self.game.all_sprites:
-                sprite.rect.x -= moved_x
-                sprite.rect.y -= moved_y
+            self.game.camera.follow(self.rect)
 
         self.x_change = 0
         self.y_change = 0
@@ -97,37 +96,15 @@ class Player(pygame.sprite.Sprite):
         if self.game.in_battle or self.game.post_battle_cooldown > 0:
             return
 
-        hits = pygame.sprite.spritecollide(self, self.game.enemies, False)
+        hits = self.game.enemy_grid.query(self.rect)
         if hits:
-            self.game.in_battle = True
-            enemy = hits[0]
-
-            # Run battle
-            battle = Battle(self.game, enemy, self.game.party)
-            result = battle.run()
-            battle.cleanup()
-            self.log.debug("Battle result " + str(result))
-
-            if result == "victory":
-                # Survived — go back to map and remove enemy sprite
-                enemy.kill()
-                self.game.in_battle = False
-                self.game.draw()
-                return
-            elif result == "escape":
-                self.game.in_battle = False
-                self.game.post_battle_cooldown = 2000
-                self.game.draw()
-                return
-            elif result == "defeat":
-                # Player was defeated — trigger game over
-                self.game.playing = False
-                return
+            # The battle scene takes over from the next frame, the map waits underneath it
+            self.game.start_battle(hits[0])
 
     def collide_blocks(self, direction):
         # check and handle collisions
         if direction == 'x':
-            hits = pygame.sprite.spritecollide(self, self.game.blocks, False)
+            hits = self.game.block_grid.query(self.rect)
             if hits:
                 # player moving right
                 if self.x_change > 0:
@@ -136,7 +113,7 @@ class Player(pygame.sprite.Sprite):
                 if self.x_change < 0:
                     self.rect.x = hits[0].rect.right
         if direction == 'y':
-            hits = pygame.sprite.spritecollide(self, self.game.blocks, False)
+            hits = self.game.block_grid.query(self.rect)
             if hits:
                 # player moving down
                 if self.y_change > 0:
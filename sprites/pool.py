@@ -0,0 +1,46 @@
+class ObjectPool:
+    """
+    Free list of released objects that are reset and handed out again instead of being rebuilt.
+
+    factory(*args) builds a new object, obj.reset(*args) prepares a recycled one. At most max_size
+    released objects are kept.
+    """
+    def __init__(self, factory, max_size=64):
+        self.factory = factory
+        self.max_size = max_size
+        self._free = []
+
+    def __len__(self):
+        return len(self._free)
+
+    def acquire(self, *args):
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args)
+            return obj
+        return self.factory(*args)
+
+    def release(self, obj):
+        if len(self._free) < self.max_size:
+            self._free.append(obj)
+
+
+class PoolHandle:
+    """Reference to one use of a pooled object, it stays dead once the object is released and reused."""
+    __slots__ = ('obj', 'generation')
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.generation = obj.generation
+
+    def alive(self):
+        return self.obj.generation == self.generation and self.obj.alive()
+
+    @property
+    def position(self):
+        """World position of a pooled sprite's top-left corner."""
+        return self.obj.rect.topleft
+
+    def kill(self):
+        if self.alive():
+            self.obj.kill()
@@ -1,11 +1,20 @@
 import pygame
 
+from assets import registry
+
 class Spritesheet:
     def __init__(self, file):
-        self.sheet = pygame.image.load(file).convert()
+        self.file = file
+        self.sheet = registry.acquire(file)
 
     def get_sprite(self, x, y, width, height, color_key):
         sprite = pygame.Surface([width, height])
         sprite.blit(self.sheet, (0, 0), (x, y, width, height))
         sprite.set_colorkey(color_key)
-        return sprite
\ No newline at end of file
+        return sprite
+
+    def release(self):
+        """Hand the shared sheet back to the registry once no more sprites will be cut from it."""
+        if self.sheet is not None:
+            registry.release(self.file)
+            self.sheet = None
\ No newline at end of file
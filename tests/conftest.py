@@ -0,0 +1,17 @@
+import os
+import sys
+
+# Headless: no window or sound device is needed to run the tests
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    """Asset paths in the game are relative to the repository root."""
+    monkeypatch.chdir(ROOT)
@@ -0,0 +1,71 @@
+import time
+
+import pygame
+import pytest
+
+from audio import music_player
+from audio.audio_manager import AudioManager
+
+BROKEN = 'audio/music/broken.mp3'
+
+
+def fake_load_sound(path):
+    """Stands in for the decoder: a short silent Sound, or a failure for BROKEN."""
+    if path == BROKEN:
+        raise ValueError("corrupt frame")
+    return pygame.mixer.Sound(buffer=bytes(4096))
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(music_player.disk_cache, 'load_sound', fake_load_sound)
+    audio = AudioManager()
+    yield audio
+    audio.close()
+    pygame.mixer.quit()
+
+
+def settle(manager, timeout=5.0):
+    """Run frames until the pending track has switched or failed."""
+    deadline = time.monotonic() + timeout
+    while manager.music.pending is not None:
+        assert time.monotonic() < deadline, "music decode did not finish"
+        manager.update_music()
+        time.sleep(0.001)
+
+
+def test_failed_decode_keeps_the_current_track(manager):
+    manager.play_music('audio/music/Battle.mp3')
+    settle(manager)
+    manager.play_music(BROKEN)
+    settle(manager)
+
+    assert manager.music.current == 'audio/music/Battle.mp3'
+    assert manager._previous_track is None
+
+
+def test_failed_track_can_be_played_again(manager):
+    manager.play_music('audio/music/Battle.mp3')
+    settle(manager)
+    manager.play_music(BROKEN)
+    settle(manager)
+
+    # Not mistaken for the current track, so the retry decodes again (and fails again)
+    manager.play_music(BROKEN)
+    assert manager.music.pending == BROKEN
+    settle(manager)
+    assert manager.music.current == 'audio/music/Battle.mp3'
+
+
+def test_resume_returns_to_the_track_that_was_playing(manager):
+    manager.play_music('audio/music/Main Theme.mp3')
+    settle(manager)
+    manager.play_music('audio/music/Battle.mp3')
+    settle(manager)
+    manager.play_music(BROKEN)
+    settle(manager)
+
+    manager.resume_previous_music()
+    settle(manager)
+    assert manager.music.current == 'audio/music/Main Theme.mp3'
+    assert manager._previous_track == 'audio/music/Battle.mp3'
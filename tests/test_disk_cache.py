@@ -0,0 +1,77 @@
+import os
+
+import pygame
+import pytest
+
+from assets.disk_cache import DiskCache
+
+IMAGE = 'img/enemy.png'
+SOUND = 'audio/sounds/attack_hit.mp3'
+
+
+@pytest.fixture
+def cache(tmp_path):
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    pygame.mixer.init()
+    yield DiskCache(directory=str(tmp_path), max_bytes=1 << 30, enabled=True)
+    pygame.mixer.quit()
+    pygame.display.quit()
+
+
+def truncate(path, remove):
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) - remove)
+
+
+def test_image_hit_matches_decoded_alpha_surface(cache):
+    decoded = cache.load_image(IMAGE, alpha=True)
+    cached = cache.load_image(IMAGE, alpha=True)
+
+    assert cache.hits == 1
+    assert cached.get_flags() == decoded.get_flags()
+    assert cached.get_masks() == decoded.get_masks()
+    assert pygame.image.tobytes(cached, 'RGBA') == pygame.image.tobytes(decoded, 'RGBA')
+
+
+def test_corrupt_image_entry_is_decoded_again(cache):
+    decoded = cache.load_image(IMAGE, alpha=True)
+    entry = cache._entry_path(IMAGE, 'image alpha=True')
+    size = os.path.getsize(entry)
+    truncate(entry, 100)
+
+    reloaded = cache.load_image(IMAGE, alpha=True)
+
+    assert cache.hits == 0
+    assert reloaded.get_size() == decoded.get_size()
+    assert os.path.getsize(entry) == size  # rewritten by the fresh decode
+    cache.load_image(IMAGE, alpha=True)
+    assert cache.hits == 1
+
+
+def test_corrupt_sound_entry_is_decoded_again(cache):
+    decoded = cache.load_sound(SOUND)
+    variant = f"sound mixer={pygame.mixer.get_init()}"
+    entry = cache._entry_path(SOUND, variant)
+    size = os.path.getsize(entry)
+    truncate(entry, 1)  # no longer a whole number of sample frames
+
+    reloaded = cache.load_sound(SOUND)
+
+    assert cache.hits == 0
+    assert reloaded.get_raw() == decoded.get_raw()
+    assert os.path.getsize(entry) == size
+    assert cache.load_sound(SOUND).get_raw() == decoded.get_raw()
+    assert cache.hits == 1
+
+
+def test_empty_sound_entry_is_a_miss(cache):
+    cache.load_sound(SOUND)
+    entry = cache._entry_path(SOUND, f"sound mixer={pygame.mixer.get_init()}")
+    with open(entry, 'rb') as f:
+        header = f.read(cache._data_offset(2))  # header and the '{}' metadata, no samples
+    with open(entry, 'wb') as f:
+        f.write(header)
+
+    assert cache.load_sound(SOUND).get_length() > 0
+    assert cache.hits == 0
@@ -0,0 +1,6 @@
+from .camera import Camera, interpolated_rect
+from .tile_layer import TileLayer
+from .renderer import DirtyRectRenderer, merge_rects
+from .spatial_index import SpatialGrid
+from .map_file import MapFile, write_map
+from .chunk_streamer import ChunkStreamer
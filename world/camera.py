@@ -0,0 +1,67 @@
+import pygame
+
+
+def interpolated_rect(sprite, alpha):
+    """
+    World rect of a sprite alpha of the way from its previous tick position to its current one.
+
+    Sprites that move set previous_pos in their update(), the others are drawn where they are.
+    """
+    previous = getattr(sprite, 'previous_pos', None)
+    if previous is None or alpha >= 1:
+        return sprite.rect
+    rect = sprite.rect
+    return rect.move(round((previous[0] - rect.x) * (1 - alpha)), round((previous[1] - rect.y) * (1 - alpha)))
+
+
+class Camera:
+    """
+    Viewport onto the world. Sprites keep their world rects and the offset is applied at draw time,
+    so scrolling costs the same no matter how many sprites the map holds.
+
+    follow() moves the camera for the current simulation tick. Between ticks interpolate() places the
+    drawing offset between the previous and current tick positions.
+    """
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.offset_x = 0
+        self.offset_y = 0
+        self._current = (0, 0)
+        self._previous = (0, 0)
+
+    @property
+    def view_rect(self):
+        """The world area currently on screen."""
+        return pygame.Rect(self.offset_x, self.offset_y, self.width, self.height)
+
+    def follow(self, rect):
+        """Center the view on a world rect."""
+        self.offset_x = rect.centerx - self.width // 2
+        self.offset_y = rect.centery - self.height // 2
+        self._current = (self.offset_x, self.offset_y)
+
+    def begin_tick(self):
+        self._previous = self._current
+
+    def interpolate(self, alpha):
+        """Set the drawing offset alpha (0..1) of the way from the previous tick to the current one."""
+        # Same rounding as interpolated_rect() so the followed sprite stays put on screen
+        (px, py), (cx, cy) = self._previous, self._current
+        self.offset_x = cx + round((px - cx) * (1 - alpha))
+        self.offset_y = cy + round((py - cy) * (1 - alpha))
+
+    def apply(self, rect):
+        """Screen rect of a world rect."""
+        return rect.move(-self.offset_x, -self.offset_y)
+
+    def to_world(self, pos):
+        return pos[0] + self.offset_x, pos[1] + self.offset_y
+
+    def draw(self, surface, sprites, alpha=1.0):
+        """Blit the sprites that intersect the view, in the group's layer order."""
+        view = self.view_rect
+        for sprite in sprites:
+            rect = interpolated_rect(sprite, alpha)
+            if view.colliderect(rect):
+                surface.blit(sprite.image, (rect.x - self.offset_x, rect.y - self.offset_y))
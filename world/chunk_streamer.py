@@ -0,0 +1,88 @@
+from config import CHUNK_LOAD_RADIUS, TILESIZE
+from logger_config import logger
+
+
+class ChunkStreamer:
+    """
+    Keeps the chunks of a MapFile within radius of the player loaded.
+
+    Loading a chunk bakes its terrain into the tile layer and creates its blocks and enemies through
+    spawn_block/spawn_enemy. Chunks more than one chunk beyond radius are unloaded with their blocks.
+    Enemies wander off their spawn chunk, so they are removed by where they are now, once that is as
+    far away; enemies defeated in battle are remembered and not spawned again.
+    """
+    def __init__(self, map_file, tile_layer, spawn_block, spawn_enemy, radius=CHUNK_LOAD_RADIUS):
+        self.log = logger.getChild(__name__)
+        self.map_file = map_file
+        self.tile_layer = tile_layer
+        self.spawn_block = spawn_block
+        self.spawn_enemy = spawn_enemy
+        self.radius = radius
+        self.loaded = {}  # {(cx, cy): [block, ...]}
+        self.enemies = {}  # {spawn: enemy handle} for every enemy in play, wherever it wandered
+        self.defeated = set()
+        self._center = None
+
+    def chunk_at(self, pos):
+        chunk_size = self.map_file.chunk_tiles * TILESIZE
+        return pos[0] // chunk_size, pos[1] // chunk_size
+
+    def update(self, pos):
+        """Stream chunks around a world position, cheap when the position stays in the same chunk."""
+        center = self.chunk_at(pos)
+        if center == self._center:
+            return
+        self._center = center
+        cx, cy = center
+
+        for chunk in [c for c in self.loaded if self._too_far(c)]:
+            self.unload(chunk)
+        for spawn, enemy in list(self.enemies.items()):
+            if not enemy.alive():
+                # Killed while in play, i.e. beaten in battle
+                self.defeated.add(spawn)
+                del self.enemies[spawn]
+            elif self._too_far(self.chunk_at(enemy.position)):
+                enemy.kill()
+                del self.enemies[spawn]
+
+        for y in range(cy - self.radius, cy + self.radius + 1):
+            for x in range(cx - self.radius, cx + self.radius + 1):
+                if (x, y) not in self.loaded and self.map_file.contains_chunk(x, y):
+                    self.load((x, y))
+
+    def _too_far(self, chunk):
+        cx, cy = self._center
+        return max(abs(chunk[0] - cx), abs(chunk[1] - cy)) > self.radius + 1
+
+    def load(self, chunk):
+        cx, cy = chunk
+        rows = self.map_file.chunk_rows_text(cx, cy)
+        self.tile_layer.load_chunk(cx, cy, rows)
+
+        blocks = []
+        first_col = cx * self.map_file.chunk_tiles
+        first_row = cy * self.map_file.chunk_tiles
+        for row, line in enumerate(rows):
+            for col, char in enumerate(line):
+                if char == 'B':
+                    blocks.append(self.spawn_block(first_col + col, first_row + row))
+        for spawn in self.map_file.chunk_spawns(cx, cy):
+            char, col, row = spawn
+            # An enemy that wandered off and is still in play is not spawned twice
+            if char == 'E' and spawn not in self.defeated and spawn not in self.enemies:
+                self.enemies[spawn] = self.spawn_enemy(col, row)
+        self.loaded[chunk] = blocks
+
+    def unload(self, chunk):
+        self.tile_layer.unload_chunk(*chunk)
+        for block in self.loaded.pop(chunk):
+            block.kill()
+
+    def close(self):
+        for chunk in list(self.loaded):
+            self.unload(chunk)
+        for enemy in self.enemies.values():
+            enemy.kill()
+        self.enemies.clear()
+        self.map_file.close()
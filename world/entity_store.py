@@ -0,0 +1,170 @@
+import random
+
+import numpy as np
+
+from config import ENEMY_SPEED, TILESIZE
+
+LEFT = 0
+RIGHT = 1
+FACINGS = ('left', 'right')
+
+
+class EnemyHandle:
+    """Stands in for an Enemy sprite while the enemy only exists as a row of the store."""
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+        self.generation = store.generation[index]
+
+    def alive(self):
+        return self.store.is_alive(self.index, self.generation)
+
+    @property
+    def position(self):
+        """World position of the enemy's top-left corner."""
+        return int(self.store.x[self.index]), int(self.store.y[self.index])
+
+    def kill(self):
+        if self.alive():
+            self.store.remove(self.index)
+
+
+class EnemyStore:
+    """
+    Wandering enemies kept as NumPy arrays (position, facing, travel counter, animation frame, HP).
+
+    update() advances every enemy at once with the same rules as Enemy.movement()/animate(), and
+    sync() materializes Enemy sprites only for rows inside the view, releasing them when they leave.
+    Materialized sprites are driven by the store and their own update() does nothing. Rows of removed
+    enemies are reused by later spawns, handles to the old enemy stay dead.
+    """
+    def __init__(self, game, capacity=64):
+        self.game = game
+        self.count = 0
+        self.names = []
+        self.jobs = []
+        self.sprites = {}  # {index: Enemy} for rows currently on screen
+        self.free = []  # removed rows waiting to be reused
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        def grow(array, dtype):
+            new = np.zeros(capacity, dtype=dtype)
+            if array is not None:
+                new[:self.count] = array[:self.count]
+            return new
+
+        self.x = grow(getattr(self, 'x', None), np.int64)
+        self.y = grow(getattr(self, 'y', None), np.int64)
+        self.x_change = grow(getattr(self, 'x_change', None), np.int64)
+        self.facing = grow(getattr(self, 'facing', None), np.int8)
+        self.movement_loop = grow(getattr(self, 'movement_loop', None), np.int64)
+        self.max_travel = grow(getattr(self, 'max_travel', None), np.int64)
+        self.animation_loop = grow(getattr(self, 'animation_loop', None), np.float64)
+        self.frame = grow(getattr(self, 'frame', None), np.int8)
+        self.health = grow(getattr(self, 'health', None), np.int64)
+        self.alive = grow(getattr(self, 'alive', None), bool)
+        self.generation = grow(getattr(self, 'generation', None), np.int64)
+
+    def __len__(self):
+        return int(self.alive[:self.count].sum())
+
+    def spawn(self, name, job, col, row):
+        """Add an enemy at a tile position, returns an EnemyHandle."""
+        if self.free:
+            i = self.free.pop()
+            self.names[i] = name
+            self.jobs[i] = job
+        else:
+            if self.count == len(self.x):
+                self._allocate(len(self.x) * 2)
+            i = self.count
+            self.count += 1
+            self.names.append(name)
+            self.jobs.append(job)
+
+        self.x[i] = col * TILESIZE
+        self.y[i] = row * TILESIZE
+        self.x_change[i] = 0
+        self.facing[i] = random.choice([LEFT, RIGHT])
+        self.movement_loop[i] = 0
+        self.max_travel[i] = random.randint(7, 30)
+        self.animation_loop[i] = 1
+        self.frame[i] = 0
+        self.health[i] = job.get_base_stats()['HP']
+        self.alive[i] = True
+        self.generation[i] += 1
+        return EnemyHandle(self, i)
+
+    def is_alive(self, index, generation):
+        return bool(self.alive[index]) and self.generation[index] == generation
+
+    def remove(self, index):
+        self.alive[index] = False
+        self.free.append(index)
+        sprite = self.sprites.pop(index, None)
+        if sprite is not None:
+            sprite.release()
+
+    def update(self):
+        """One tick of Enemy.movement() and Enemy.animate() for every live row."""
+        n = self.count
+        alive = self.alive[:n]
+        facing = self.facing[:n]
+        loop = self.movement_loop[:n]
+        max_travel = self.max_travel[:n]
+
+        # Left then right, like the two sequential ifs in Enemy.movement()
+        left = alive & (facing == LEFT)
+        x_change = np.where(left, -ENEMY_SPEED, 0)
+        loop -= left
+        facing[left & (loop <= -max_travel)] = RIGHT
+
+        right = alive & (facing == RIGHT)
+        x_change += np.where(right, ENEMY_SPEED, 0)
+        loop += right
+        facing[right & (loop >= max_travel)] = LEFT
+
+        # Walking frames cycle 1..2 every 10 ticks, standing still shows frame 0
+        walking = alive & (x_change != 0)
+        anim = self.animation_loop[:n]
+        self.frame[:n] = np.where(walking, np.floor(anim), 0)
+        anim += np.where(walking, 0.1, 0.0)
+        anim[walking & (anim >= 3)] = 1
+
+        self.x_change[:n] = x_change
+        self.x[:n] += x_change
+
+    def sync(self, view):
+        """Materialize rows inside view as sprites, release the ones that left it."""
+        n = self.count
+        visible = (self.alive[:n]
+                   & (self.x[:n] < view.right) & (self.x[:n] + TILESIZE > view.left)
+                   & (self.y[:n] < view.bottom) & (self.y[:n] + TILESIZE > view.top))
+        visible_rows = set(np.flatnonzero(visible).tolist())
+
+        for index in [i for i in self.sprites if i not in visible_rows]:
+            sprite = self.sprites.pop(index)
+            self.health[index] = sprite.current_health
+            sprite.release()
+
+        for index in visible_rows:
+            sprite = self.sprites.get(index)
+            if sprite is None:
+                sprite = self._materialize(index)
+            else:
+                sprite.previous_pos = sprite.rect.topleft
+            sprite.facing = FACINGS[self.facing[index]]
+            frames = sprite.left_animations if self.facing[index] == LEFT else sprite.right_animations
+            sprite.image = frames[self.frame[index]]
+            sprite.rect.topleft = (int(self.x[index]), int(self.y[index]))
+            self.game.enemy_grid.move(sprite)
+
+    def _materialize(self, index):
+        sprite = self.game.enemy_pool.acquire(self.names[index], self.jobs[index], 0, 0)
+        sprite.rect.topleft = (int(self.x[index]), int(self.y[index]))
+        sprite.current_health = int(self.health[index])
+        sprite.store = self
+        sprite.store_index = index
+        self.sprites[index] = sprite
+        return sprite
@@ -0,0 +1,124 @@
+import mmap
+import struct
+import sys
+
+from config import CHUNK_TILES
+
+# Binary map layout (little endian):
+#   header   MAGIC, version u8, cols u32, rows u32, chunk_tiles u16
+#   tiles    one tile id byte per cell, stored chunk by chunk (row-major inside a chunk), edge chunks
+#            padded with VOID so every chunk is chunk_tiles * chunk_tiles bytes
+#   index    chunk_count + 1 u32 offsets into the spawn records, spawns of chunk i are [index[i], index[i + 1])
+#   spawns   kind u8 (tilemap character), col u32, row u32
+MAGIC = b'PKMAP'
+VERSION = 1
+HEADER = struct.Struct('<5sBIIH')
+OFFSET = struct.Struct('<I')
+SPAWN = struct.Struct('<BII')
+
+# Tile ids and the tilemap characters they stand for
+TILE_CHARS = {0: '.', 1: 'B'}
+TILE_IDS = {char: tile_id for tile_id, char in TILE_CHARS.items()}
+VOID = 255
+VOID_CHAR = ' '
+
+# Tilemap characters that are entity spawns on top of open ground
+SPAWN_CHARS = 'PE'
+
+
+def write_map(path, tilemap, chunk_tiles=CHUNK_TILES):
+    """Convert a list of tilemap row strings into the binary chunked format."""
+    rows = len(tilemap)
+    cols = max((len(row) for row in tilemap), default=0)
+    chunk_cols = -(-cols // chunk_tiles)
+    chunk_rows = -(-rows // chunk_tiles)
+
+    tiles = bytearray()
+    spawns = [[] for _ in range(chunk_cols * chunk_rows)]
+    for cy in range(chunk_rows):
+        for cx in range(chunk_cols):
+            for row in range(cy * chunk_tiles, (cy + 1) * chunk_tiles):
+                for col in range(cx * chunk_tiles, (cx + 1) * chunk_tiles):
+                    char = tilemap[row][col] if row < rows and col < len(tilemap[row]) else None
+                    if char is None:
+                        tiles.append(VOID)
+                    elif char in SPAWN_CHARS:
+                        tiles.append(TILE_IDS['.'])
+                        spawns[cy * chunk_cols + cx].append(SPAWN.pack(ord(char), col, row))
+                    else:
+                        tiles.append(TILE_IDS[char])
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, cols, rows, chunk_tiles))
+        f.write(tiles)
+        offset = 0
+        for chunk_spawns in spawns:
+            f.write(OFFSET.pack(offset))
+            offset += len(chunk_spawns)
+        f.write(OFFSET.pack(offset))
+        for chunk_spawns in spawns:
+            f.write(b''.join(chunk_spawns))
+
+
+class MapFile:
+    """Read-only memory-mapped view of a binary map, chunks are decoded only when asked for."""
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.cols, self.rows, self.chunk_tiles = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} map file")
+
+        self.chunk_cols = -(-self.cols // self.chunk_tiles)
+        self.chunk_rows = -(-self.rows // self.chunk_tiles)
+        self._chunk_bytes = self.chunk_tiles * self.chunk_tiles
+        self._tiles_offset = HEADER.size
+        self._index_offset = self._tiles_offset + self.chunk_cols * self.chunk_rows * self._chunk_bytes
+        self._spawns_offset = self._index_offset + (self.chunk_cols * self.chunk_rows + 1) * OFFSET.size
+
+    def _chunk_index(self, cx, cy):
+        return cy * self.chunk_cols + cx
+
+    def contains_chunk(self, cx, cy):
+        return 0 <= cx < self.chunk_cols and 0 <= cy < self.chunk_rows
+
+    def chunk_rows_text(self, cx, cy):
+        """Chunk-local rows as tilemap strings, VOID cells become VOID_CHAR."""
+        start = self._tiles_offset + self._chunk_index(cx, cy) * self._chunk_bytes
+        data = self._map[start:start + self._chunk_bytes]
+        n = self.chunk_tiles
+        return [''.join(TILE_CHARS.get(tile_id, VOID_CHAR) for tile_id in data[i:i + n])
+                for i in range(0, len(data), n)]
+
+    def chunk_spawns(self, cx, cy):
+        """[(char, col, row)] entity spawns inside a chunk, in world tile coordinates."""
+        index = self._chunk_index(cx, cy)
+        first, = OFFSET.unpack_from(self._map, self._index_offset + index * OFFSET.size)
+        last, = OFFSET.unpack_from(self._map, self._index_offset + (index + 1) * OFFSET.size)
+        spawns = []
+        for i in range(first, last):
+            kind, col, row = SPAWN.unpack_from(self._map, self._spawns_offset + i * SPAWN.size)
+            spawns.append((chr(kind), col, row))
+        return spawns
+
+    def find_spawn(self, char):
+        """First spawn of a kind anywhere on the map, scanning the spawn records only."""
+        total, = OFFSET.unpack_from(self._map, self._index_offset + self.chunk_cols * self.chunk_rows * OFFSET.size)
+        for i in range(total):
+            kind, col, row = SPAWN.unpack_from(self._map, self._spawns_offset + i * SPAWN.size)
+            if chr(kind) == char:
+                return col, row
+        return None
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+if __name__ == "__main__":
+    # python -m world.map_file maps/overworld.pkmap  converts config.tilemap
+    from config import tilemap
+    write_map(sys.argv[1], tilemap)
@@ -0,0 +1,80 @@
+import pygame
+
+from config import BLACK
+from .camera import interpolated_rect
+
+
+def merge_rects(rects):
+    """Union overlapping rects so shared regions are only repainted once."""
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        overlapping = rect.collidelist(merged)
+        while overlapping != -1:
+            rect.union_ip(merged.pop(overlapping))
+            overlapping = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRectRenderer:
+    """
+    Overworld renderer that only repaints and pushes the screen regions that changed since last frame.
+
+    A region is dirty when a visible sprite moved, changed image, appeared or disappeared. Any camera
+    scroll (or invalidate()) repaints everything and asks for a full display update instead.
+    """
+    def __init__(self):
+        self._drawn = {}  # {sprite: (screen_rect, image)} as of the last frame
+        self._offset = None
+        self._full_redraw = True
+
+    def invalidate(self):
+        """Force a full repaint, e.g. after another screen drew over the overworld."""
+        self._full_redraw = True
+
+    def draw(self, screen, camera, tile_layer, sprites, alpha=1.0):
+        """Paint the frame, returns the dirty rects to update or None when the whole display must be flipped."""
+        view = camera.view_rect
+        current = {}
+        for sprite in sprites:
+            rect = interpolated_rect(sprite, alpha)
+            if view.colliderect(rect):
+                current[sprite] = (camera.apply(rect), sprite.image)
+
+        offset = (camera.offset_x, camera.offset_y)
+        if self._full_redraw or offset != self._offset:
+            screen.fill(BLACK)
+            tile_layer.draw(screen, camera)
+            for rect, image in current.values():
+                screen.blit(image, rect)
+            self._drawn = current
+            self._offset = offset
+            self._full_redraw = False
+            return None
+
+        dirty = []
+        for sprite, (rect, image) in current.items():
+            previous = self._drawn.get(sprite)
+            if previous is None:
+                dirty.append(rect)
+            elif previous[0] != rect or previous[1] is not image:
+                dirty.append(previous[0])
+                dirty.append(rect)
+        for sprite, (rect, image) in self._drawn.items():
+            if sprite not in current:
+                dirty.append(rect)
+
+        dirty = merge_rects(dirty)
+        for area in dirty:
+            # Repaint terrain and every sprite overlapping the region, clipped to it
+            screen.set_clip(area)
+            screen.fill(BLACK, area)
+            tile_layer.draw(screen, camera)
+            for rect, image in current.values():
+                if rect.colliderect(area):
+                    screen.blit(image, rect)
+        screen.set_clip(None)
+
+        self._drawn = current
+        return dirty
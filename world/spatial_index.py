@@ -0,0 +1,70 @@
+from itertools import count
+
+from config import TILESIZE
+
+
+class SpatialGrid:
+    """
+    Uniform grid of buckets holding sprites by the cells their rect covers.
+
+    Static sprites (blocks) are inserted once, moving ones call move() after changing their rect and
+    only change buckets when they cross a cell edge. query() only looks at the cells under the rect.
+    """
+    def __init__(self, cell_size=TILESIZE):
+        self.cell_size = cell_size
+        self._buckets = {}  # {(cx, cy): [sprite, ...]}
+        self._cells = {}  # {sprite: (first_cx, first_cy, last_cx, last_cy)}
+        self._order = {}  # insertion order so hits come back in group order
+        self._counter = count()
+
+    def __len__(self):
+        return len(self._cells)
+
+    def __contains__(self, sprite):
+        return sprite in self._cells
+
+    def _cell_range(self, rect):
+        size = self.cell_size
+        return rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size
+
+    def _cells_of(self, cell_range):
+        first_cx, first_cy, last_cx, last_cy = cell_range
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                yield cx, cy
+
+    def insert(self, sprite):
+        cell_range = self._cell_range(sprite.rect)
+        self._cells[sprite] = cell_range
+        self._order[sprite] = next(self._counter)
+        for cell in self._cells_of(cell_range):
+            self._buckets.setdefault(cell, []).append(sprite)
+
+    def remove(self, sprite):
+        cell_range = self._cells.pop(sprite, None)
+        if cell_range is None:
+            return
+        del self._order[sprite]
+        for cell in self._cells_of(cell_range):
+            bucket = self._buckets[cell]
+            bucket.remove(sprite)
+            if not bucket:
+                del self._buckets[cell]
+
+    def move(self, sprite):
+        """Re-bucket a sprite after its rect changed."""
+        if self._cell_range(sprite.rect) != self._cells.get(sprite):
+            order = self._order.get(sprite)
+            self.remove(sprite)
+            self.insert(sprite)
+            if order is not None:
+                self._order[sprite] = order
+
+    def query(self, rect):
+        """Sprites whose rect collides with rect, in insertion order."""
+        hits = set()
+        for cell in self._cells_of(self._cell_range(rect)):
+            for sprite in self._buckets.get(cell, ()):
+                if sprite.rect.colliderect(rect):
+                    hits.add(sprite)
+        return sorted(hits, key=self._order.__getitem__)
@@ -0,0 +1,71 @@
+import pygame
+
+from config import CHUNK_TILES, TILESIZE
+
+
+class TileLayer:
+    """
+    Static terrain baked into chunk surfaces of chunk_tiles x chunk_tiles cells.
+
+    tiles maps a tilemap character to the surfaces stacked on that cell (bottom first), cells whose
+    character is missing use default. Drawing blits only the loaded chunks under the camera.
+    """
+    def __init__(self, cols, rows, tiles, default, chunk_tiles=CHUNK_TILES):
+        self.cols = cols
+        self.rows = rows
+        self.tiles = tiles
+        self.default = default
+        self.chunk_tiles = chunk_tiles
+        self.chunk_size = chunk_tiles * TILESIZE
+        self.chunks = {}
+
+    @classmethod
+    def from_tilemap(cls, tilemap, tiles, default, chunk_tiles=CHUNK_TILES):
+        """Bake every chunk of an in-memory list of row strings up front."""
+        layer = cls(max((len(row) for row in tilemap), default=0), len(tilemap), tiles, default, chunk_tiles)
+        for cy in range(layer.chunk_rows):
+            for cx in range(layer.chunk_cols):
+                rows = [row[cx * chunk_tiles:(cx + 1) * chunk_tiles]
+                        for row in tilemap[cy * chunk_tiles:(cy + 1) * chunk_tiles]]
+                layer.load_chunk(cx, cy, rows)
+        return layer
+
+    @property
+    def chunk_cols(self):
+        return -(-self.cols // self.chunk_tiles)
+
+    @property
+    def chunk_rows(self):
+        return -(-self.rows // self.chunk_tiles)
+
+    def load_chunk(self, cx, cy, rows):
+        """Bake a chunk from its chunk-local row strings."""
+        self.chunks[(cx, cy)] = self.bake(rows)
+
+    def unload_chunk(self, cx, cy):
+        self.chunks.pop((cx, cy), None)
+
+    def bake(self, rows):
+        surface = pygame.Surface((self.chunk_size, self.chunk_size))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill((0, 0, 0))
+
+        for row, line in enumerate(rows):
+            for col, char in enumerate(line):
+                for image in self.tiles.get(char, self.default):
+                    surface.blit(image, (col * TILESIZE, row * TILESIZE))
+        return surface
+
+    def draw(self, surface, camera):
+        view = camera.view_rect
+        first_cx = max(0, view.left // self.chunk_size)
+        first_cy = max(0, view.top // self.chunk_size)
+        last_cx = min(self.chunk_cols - 1, (view.right - 1) // self.chunk_size)
+        last_cy = min(self.chunk_rows - 1, (view.bottom - 1) // self.chunk_size)
+
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                chunk = self.chunks.get((cx, cy))
+                if chunk is not None:
+                    surface.blit(chunk, (cx * self.chunk_size - camera.offset_x, cy * self.chunk_size - camera.offset_y))